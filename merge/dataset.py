@@ -0,0 +1,213 @@
+import argparse
+import os
+import pandas as pd
+
+# Normalized layout of the unified dataset: every program and every distinct course is stored once,
+# program_courses links them in the original row order
+PROGRAMS_FILE = "programs.csv"
+COURSES_FILE = "courses.csv"
+PROGRAM_COURSES_FILE = "program_courses.csv"
+
+# Columnar copy (Parquet, needs pyarrow): low-cardinality fields are stored dictionary-encoded
+CATEGORICAL_COLUMNS = ["Institution", "Location", "Degree Type", "Modality", "Study Format"]
+
+# Rows per chunk when a wide CSV file is streamed
+CHUNK_ROWS = int(os.environ.get("MERGE_CHUNK_ROWS", "10000"))
+
+def is_course_column(column):
+    return column.startswith("Course ") or column == "Prerequisites"
+
+def row_hashes(df):
+    """64-bit hash per row, used as a compact key for deduplication"""
+    return pd.util.hash_pandas_object(df, index=False)
+
+class DatasetWriter:
+    """Writes the normalized tables incrementally from chunks of the wide frame"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        # Only hashes are kept in memory: program fields per Program ID, and Course ID per course row
+        self.programs = {}
+        self.course_ids = {}
+        self.conflicts = set()
+        self.links = 0
+        self._started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self, df, name):
+        df.to_csv(os.path.join(self.directory, name), mode="a" if self._started else "w",
+                  header=not self._started, index=False)
+
+    def append(self, chunk):
+        if chunk.empty:
+            return
+        course_columns = [col for col in chunk.columns if is_course_column(col)]
+        program_columns = [col for col in chunk.columns if col not in course_columns]
+
+        new_programs = []
+        for i, (program_id, row_hash) in enumerate(zip(chunk["Program ID"], row_hashes(chunk[program_columns]))):
+            if program_id not in self.programs:
+                self.programs[program_id] = row_hash
+                new_programs.append(i)
+            elif self.programs[program_id] != row_hash:
+                self.conflicts.add(program_id)
+
+        # Identical course rows (e.g. a course list shared by several programs) get one Course ID
+        course_ids, new_courses = [], []
+        for i, row_hash in enumerate(row_hashes(chunk[course_columns])):
+            if row_hash not in self.course_ids:
+                self.course_ids[row_hash] = len(self.course_ids)
+                new_courses.append(i)
+            course_ids.append(self.course_ids[row_hash])
+
+        courses = chunk.iloc[new_courses][course_columns]
+        courses.insert(0, "Course ID", [course_ids[i] for i in new_courses])
+
+        if not self._started:
+            os.makedirs(self.directory, exist_ok=True)
+        self._write(chunk.iloc[new_programs][program_columns], PROGRAMS_FILE)
+        self._write(courses, COURSES_FILE)
+        self._write(pd.DataFrame({"Program ID": chunk["Program ID"].values, "Course ID": course_ids}), PROGRAM_COURSES_FILE)
+        self._started = True
+        self.links += len(chunk)
+
+    def close(self):
+        if not self._started:
+            return
+        if self.conflicts:
+            print(f"[WARNING] Program fields differ between rows of {len(self.conflicts)} program(s), keeping the first row.")
+        print(f"[OK] Normalized dataset saved to '{self.directory}' ({len(self.programs)} programs, "
+              f"{len(self.course_ids)} courses, {self.links} links)")
+
+class ParquetWriter:
+    """Appends chunks to a Parquet file; the schema is fixed by the first chunk (raises ImportError without pyarrow).
+    Chunks go to a temporary file that replaces the output on close(), so a failed run leaves no truncated file."""
+
+    def __init__(self, path):
+        import pyarrow
+        import pyarrow.parquet
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.schema = None
+        self.writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _schema(self, df):
+        fields = []
+        for col in df.columns:
+            if col in CATEGORICAL_COLUMNS:
+                field_type = self._pa.dictionary(self._pa.int32(), self._pa.string())
+            elif pd.api.types.is_numeric_dtype(df[col]):
+                field_type = self._pa.from_numpy_dtype(df[col].dtype)
+            else:
+                field_type = self._pa.string()
+            fields.append((col, field_type))
+        return self._pa.schema(fields)
+
+    def append(self, chunk):
+        if self.writer is None:
+            self.schema = self._schema(chunk)
+            self.writer = self._pq.ParquetWriter(self.tmp_path, self.schema)
+        self.writer.write_table(self._pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+            os.replace(self.tmp_path, self.path)
+            print(f"[OK] Columnar data saved to '{self.path}'")
+
+    def abort(self):
+        """Discards the chunks written so far"""
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def wide_view(programs, courses, program_courses):
+    """Compatibility view: rebuilds the wide frame with one row per program and course"""
+    wide_df = (program_courses
+               .merge(programs, on="Program ID", how="left")
+               .merge(courses, on="Course ID", how="left"))
+    columns = list(programs.columns) + [col for col in courses.columns if col != "Course ID"]
+    return wide_df[columns]
+
+def write_dataset(wide_df, directory):
+    with DatasetWriter(directory) as writer:
+        writer.append(wide_df)
+
+def write_parquet(df, path):
+    """Writes a typed Parquet copy; returns False if no Parquet engine is installed"""
+    try:
+        writer = ParquetWriter(path)
+    except ImportError:
+        print(f"[INFO] pyarrow is not installed, skipping '{path}'")
+        return False
+    with writer:
+        writer.append(df)
+    return True
+
+# Values are read as text and NA markers such as "nan" are kept, so the wide view matches the source cell by cell
+def read_table(path):
+    table = pd.read_csv(path, dtype=str, keep_default_na=False)
+    if "Course ID" in table.columns:
+        table["Course ID"] = table["Course ID"].astype(int)
+    return table
+
+def read_dataset(directory):
+    """Returns the programs, courses and program_courses tables of a normalized dataset"""
+    programs = read_table(os.path.join(directory, PROGRAMS_FILE))
+    courses = read_table(os.path.join(directory, COURSES_FILE))
+    program_courses = read_table(os.path.join(directory, PROGRAM_COURSES_FILE))
+    return programs, courses, program_courses
+
+def read_wide(directory):
+    return wide_view(*read_dataset(directory))
+
+def read_columns(path, columns=None, filters=None):
+    """Loads only the given columns (and, for Parquet, only the rows matching the pyarrow filters)"""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns, filters=filters)
+    if filters:
+        raise ValueError("Filters are only supported for Parquet files")
+    return pd.read_csv(path, usecols=columns)
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the unified dataset between the wide and the normalized layout.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    split = subparsers.add_parser("split", help="Normalize a wide CSV file into a dataset directory")
+    split.add_argument("wide_file")
+    split.add_argument("directory")
+    wide = subparsers.add_parser("wide", help="Regenerate the wide CSV file from a dataset directory")
+    wide.add_argument("directory")
+    wide.add_argument("wide_file")
+    args = parser.parse_args()
+
+    if args.command == "split":
+        # Values are read as text, so they are stored exactly as in the wide file
+        with DatasetWriter(args.directory) as writer:
+            for chunk in pd.read_csv(args.wide_file, dtype=str, keep_default_na=False, chunksize=CHUNK_ROWS):
+                writer.append(chunk)
+    else:
+        wide_df = read_wide(args.directory)
+        wide_df.to_csv(args.wide_file, index=False)
+        print(f"[OK] Wide data saved to '{args.wide_file}' with {len(wide_df)} entries.")
+
+if __name__ == "__main__":
+    main()
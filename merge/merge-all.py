@@ -1,53 +1,132 @@
-import pandas as pd
+import os
 import glob
+import tempfile
+import time
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import dataset
+from merger import COLUMN_ORDER
 
 # Input and output
 MERGED_PATTERN = "*_merged_data.csv"
 OUTPUT_FILE = "master_programs_data_merged.csv"
+OUTPUT_PARQUET = "master_programs_data_merged.parquet"
+# Normalized copy (programs, courses, program_courses), see dataset.py
+DATASET_DIR = "master_programs_data"
+
+# Deduplication key
+KEY_COLUMNS = ["Program ID", "Course Code"]
+
+# Explicit dtypes: every column is read as text (no type inference) and written back unchanged
+DTYPES = dict.fromkeys(COLUMN_ORDER, str)
+
+# Files are loaded in parallel, each in chunks of dataset.CHUNK_ROWS rows: workers and the main process
+# hold one chunk at a time, and at most two files per worker are spooled to disk at once
+WORKERS = int(os.environ.get("MERGE_WORKERS", str(os.cpu_count() or 1)))
+
+# Worker: read one merged file in chunks, align its columns and spool the chunks to disk;
+# returns the chunk paths in order (none are kept if the file cannot be read completely)
+def load_aligned(file, spool_dir):
+    start = time.perf_counter()
+    paths = []
+    try:
+        for chunk in pd.read_csv(file, dtype=DTYPES, usecols=lambda col: col in DTYPES, chunksize=dataset.CHUNK_ROWS):
+            # Reorder and align columns (missing optional columns are filled in)
+            chunk = chunk.reindex(columns=COLUMN_ORDER, fill_value="Not Specified")
+            with tempfile.NamedTemporaryFile(dir=spool_dir, suffix=".pkl", delete=False) as f:
+                paths.append(f.name)
+            chunk.to_pickle(paths[-1])
+    except Exception as e:
+        for path in paths:
+            os.remove(path)
+        return file, None, time.perf_counter() - start, str(e)
+    return file, paths, time.perf_counter() - start, None
+
+# Aligned chunks in input order, loaded by a process pool with a bounded number of files in flight
+def iter_aligned(files, workers):
+    workers = max(1, min(workers, len(files)))
+    with tempfile.TemporaryDirectory(prefix="merge-all-") as spool_dir:
+        if workers == 1:
+            results = (load_aligned(file, spool_dir) for file in files)
+        else:
+            results = _iter_parallel(files, workers, spool_dir)
 
-# Define column order
-COLUMN_ORDER = [
-    "Program ID", "Program Title", "Institution", "Location", "Language",
-    "Study Format", "Duration", "Total Credits", "Degree Type", "Specialization",
-    "Modality", "Tuition Fees", "Academic Admission Requirements", "Language Admission Requirements",
-    "Course Code", "Course Title", "Course Credits", "Course Description", "Prerequisites"
-]
+        for file, paths, seconds, error in results:
+            if error:
+                print(f"[WARNING] Could not read {file}: {error}")
+                continue
+            rows = 0
+            for path in paths:
+                chunk = pd.read_pickle(path)
+                os.remove(path)
+                rows += len(chunk)
+                yield chunk
+            print(f"[OK] Loaded and aligned: {file} ({rows} rows in {seconds:.2f}s)")
 
-def merge_all_merged_data():
+def _iter_parallel(files, workers, spool_dir):
+    pending_files = deque(files)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while pending_files or pending:
+            while pending_files and len(pending) < 2 * workers:
+                pending.append(executor.submit(load_aligned, pending_files.popleft(), spool_dir))
+            yield pending.popleft().result()
+
+# Keep rows whose (Program ID, Course Code) has not been seen; only 64-bit key hashes are remembered
+def drop_seen(df, seen):
+    keep = []
+    for key in dataset.row_hashes(df[KEY_COLUMNS]):
+        keep.append(key not in seen)
+        seen.add(key)
+    # Boolean row mask: df[[]] would select no columns instead of no rows
+    return df[pd.Series(keep, index=df.index, dtype=bool)]
+
+def merge_all_merged_data(workers=WORKERS):
     merged_files = glob.glob(MERGED_PATTERN)
     
     if not merged_files:
         print("[ERROR] No merged CSV files found.")
         return
 
-    dataframes = []
-    for file in merged_files:
-        try:
-            df = pd.read_csv(file)
-
-            # Reorder and align columns (ignore missing optional columns)
-            missing_cols = [col for col in COLUMN_ORDER if col not in df.columns]
-            for col in missing_cols:
-                df[col] = "Not Specified"
-
-            df = df[COLUMN_ORDER]
-            dataframes.append(df)
-            print(f"[OK] Loaded and aligned: {file}")
-        except Exception as e:
-            print(f"[WARNING] Could not read {file}: {e}")
-
-    if not dataframes:
-        print("[ERROR] No data could be loaded.")
-        return
+    try:
+        parquet = dataset.ParquetWriter(OUTPUT_PARQUET)
+    except ImportError:
+        print(f"[INFO] pyarrow is not installed, skipping '{OUTPUT_PARQUET}'")
+        parquet = None
 
-    combined_df = pd.concat(dataframes, ignore_index=True)
+    # Files are appended to all outputs as they come in, so memory use does not grow with the number of files
+    seen = set()
+    rows = 0
+    loaded = False
+    tmp_file = OUTPUT_FILE + ".tmp"
+    try:
+        # The Parquet copy is only replaced if every chunk was written
+        with open(tmp_file, "w", encoding="utf-8", newline="") as out, dataset.DatasetWriter(DATASET_DIR) as normalized, \
+                parquet if parquet is not None else nullcontext():
+            for df in iter_aligned(merged_files, workers):
+                df = drop_seen(df, seen)
+                # Header-only files and chunks of duplicates add nothing
+                if df.empty:
+                    continue
+                df.to_csv(out, header=not loaded, index=False)
+                normalized.append(df)
+                if parquet is not None:
+                    parquet.append(df)
+                rows += len(df)
+                loaded = True
 
-    # Remove duplicates based on program ID and course code
-    combined_df.drop_duplicates(subset=["Program ID", "Course Code"], inplace=True)
+        if not loaded:
+            print("[ERROR] No data could be loaded.")
+            return
 
-    # Save to CSV
-    combined_df.to_csv(OUTPUT_FILE, index=False)
-    print(f"[OK] Combined merged data saved to '{OUTPUT_FILE}'")
+        os.replace(tmp_file, OUTPUT_FILE)
+        print(f"[OK] Combined merged data saved to '{OUTPUT_FILE}' with {rows} entries.")
+    finally:
+        # Left over when nothing was loaded or a file failed half-way
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
 
 if __name__ == "__main__":
-    merge_all_merged_data()
\ No newline at end of file
+    merge_all_merged_data()
@@ -0,0 +1,161 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import pandas as pd
+
+# Declarative merge specs, one JSON file per university
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+
+# Column order of every merged file
+COLUMN_ORDER = [
+    "Program ID", "Program Title", "Institution", "Location", "Language",
+    "Study Format", "Duration", "Total Credits", "Degree Type", "Specialization",
+    "Modality", "Tuition Fees", "Academic Admission Requirements", "Language Admission Requirements",
+    "Course Code", "Course Title", "Course Credits", "Course Description", "Prerequisites"
+]
+MISSING_VALUE = "Not Specified"
+
+# Column transforms available to "key" and "transform" rules
+TRANSFORMS = {
+    "strip": lambda s: s.str.strip(),
+    "lower": lambda s: s.str.lower(),
+    "upper": lambda s: s.str.upper()
+}
+
+def load_spec(name):
+    """Loads a spec by university name (specs/<name>.json) or from a JSON file path"""
+    path = name if name.endswith(".json") else os.path.join(SPEC_DIR, f"{name}.json")
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    spec.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    return spec
+
+def available_specs():
+    return sorted(os.path.splitext(os.path.basename(p))[0] for p in glob.glob(os.path.join(SPEC_DIR, "*.json")))
+
+def transform(series, steps):
+    for step in steps:
+        series = TRANSFORMS[step](series)
+    return series
+
+# Program table: one row per program, or the first row broadcast to every course
+def load_programs(rule):
+    programs = pd.read_csv(rule["file"])
+    if rule.get("rows") == "first":
+        programs = programs.iloc[[0]]
+
+    for file in rule.get("join", []):
+        programs = programs.merge(pd.read_csv(file), on="Program ID", how="left")
+
+    # Placeholder values are replaced by the first row of the fallback file
+    fallback = rule.get("fallback")
+    if fallback:
+        values = pd.read_csv(fallback["file"]).iloc[0]
+        for col in programs.columns.intersection(values.index):
+            placeholder = programs[col].isin(fallback["when"])
+            if placeholder.any():
+                programs[col] = programs[col].astype(object).where(~placeholder, values[col])
+    return programs.reset_index(drop=True)
+
+# Course table: course rows joined with their details
+def load_courses(rule, programs):
+    courses = pd.read_csv(rule["file"])
+
+    # Programs without their own course list share the list of the first program that has one
+    if rule.get("missing_programs") == "copy_first" and "Program ID" in courses.columns:
+        base_id = courses["Program ID"].iloc[0]
+        known = set(courses["Program ID"])
+        missing = [pid for pid in programs["Program ID"] if pid not in known]
+        base = courses[courses["Program ID"] == base_id]
+        courses = pd.concat([courses] + [base.assign(**{"Program ID": pid}) for pid in missing], ignore_index=True)
+
+    details = rule.get("details")
+    if details:
+        courses = join_details(courses, details)
+    return courses
+
+def join_details(courses, rule):
+    details = pd.read_csv(rule["file"])
+    if "require" in rule:
+        details = details[details[rule["require"]].notna()]
+
+    left_on = rule["on"]
+    right_on = rule.get("details_on", left_on)
+    key_columns = [f"_key{i}" for i in range(len(left_on))]
+    steps = rule.get("key", [])
+    courses = courses.assign(**{key: transform(courses[col], steps) for key, col in zip(key_columns, left_on)})
+    details = details.assign(**{key: transform(details[col], steps) for key, col in zip(key_columns, right_on)})
+    details = details.drop(columns=right_on + rule.get("drop", []))
+
+    merged = courses.merge(details, on=key_columns, how="left", suffixes=("", "_detail"), validate=rule.get("validate"))
+
+    # Columns present on both sides: the details win where set ("details"), or the course table is kept ("courses")
+    for col in courses.columns.intersection(details.columns).difference(key_columns):
+        if rule.get("prefer") == "details":
+            merged[col] = merged[f"{col}_detail"].fillna(merged[col])
+        merged = merged.drop(columns=f"{col}_detail")
+    return merged.drop(columns=key_columns)
+
+# Program fields onto course rows: one hash join on Program ID, or a cross join when courses are not
+# assigned to programs (every program gets every course)
+def broadcast(programs, courses, precedence="programs"):
+    shared = courses.columns.intersection(programs.columns).difference(["Program ID"])
+    if precedence == "programs":
+        courses = courses.drop(columns=shared)
+    else:
+        programs = programs.drop(columns=shared)
+
+    if "Program ID" in courses.columns and len(programs) > 1:
+        return programs.merge(courses, on="Program ID", how="left")
+    if "Program ID" in courses.columns:
+        # A single program row is broadcast; its Program ID only replaces the courses' one if programs take precedence
+        if precedence == "programs":
+            courses = courses.drop(columns="Program ID")
+        else:
+            programs = programs.drop(columns="Program ID")
+    return programs.merge(courses, how="cross")
+
+def finish(spec, merged):
+    for col, steps in spec.get("transform", {}).items():
+        merged[col] = transform(merged[col], steps)
+    for col in COLUMN_ORDER:
+        if col not in merged.columns:
+            merged[col] = MISSING_VALUE
+    merged = merged[COLUMN_ORDER]
+    if "fill" in spec:
+        merged = merged.fillna(spec["fill"])
+    if "unique" in spec:
+        merged = merged.drop_duplicates(subset=spec["unique"])
+    return merged
+
+def run_spec(spec):
+    """Load, join and write stages for one university"""
+    programs = load_programs(spec["programs"])
+    courses = load_courses(spec["courses"], programs)
+    merged = finish(spec, broadcast(programs, courses, spec.get("precedence", "programs")))
+
+    for pid, count in merged["Program ID"].value_counts(sort=False).items():
+        print(f"[INFO] {spec['name']}: {count} course rows for {pid}")
+    merged.to_csv(spec["output"], index=False)
+    print(f"[OK] Merged data saved to '{spec['output']}' with {len(merged)} entries.")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge program and course data from declarative university specs.")
+    parser.add_argument("specs", nargs="*", help="University spec names or JSON files (default: all specs)")
+    args = parser.parse_args(argv)
+
+    failed = []
+    for name in args.specs or available_specs():
+        try:
+            run_spec(load_spec(name))
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[ERROR] {name}: {e}")
+            failed.append(name)
+    if failed:
+        sys.exit(1)
+
+# Run main process
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,396 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+import runpy
+import subprocess
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+# Input and output
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORKERS = 5
+MANIFEST_FILE = "pipeline_manifest.json"
+
+# Pipeline steps: each script reads and writes CSV files in the working directory.
+# Dependencies between steps are derived from these file names.
+# Steps that fetch from the web always run; their outputs are hashed so that
+# downstream steps are skipped when the scraped data did not change.
+# Merge steps also list the shared modules and specs they use ("sources"), so that changing them
+# reruns the step.
+# Steps that borrow Selenium browsers ("browser") run one after another in a single long-lived worker
+# process, so the browser pool of scrapers/browser.py stays warm across them.
+STEPS = [
+    # University of British Columbia
+    {"name": "ubc-website", "script": "scrapers/scraper-ubc-website.py", "fetches": True,
+     "inputs": [], "outputs": ["ubc_website_data.csv"]},
+    {"name": "ubc-course", "script": "scrapers/scraper-ubc-course.py", "fetches": True,
+     "inputs": ["ubc_website_data.csv"], "outputs": ["ubc_course_data.csv"]},
+    {"name": "ubc-course-details", "script": "scrapers/scraper-ubc-course-details.py", "fetches": True,
+     "inputs": [], "outputs": ["ubc_course-details_data.csv"]},
+    {"name": "ubc-merge", "script": "merge/scraper-ubc-merge.py",
+     "sources": ["merge/merger.py", "merge/specs/ubc.json"],
+     "inputs": ["ubc_website_data.csv", "ubc_course-details_data.csv"], "outputs": ["ubc_merged_data.csv"]},
+
+    # National University of Singapore
+    {"name": "nus-website", "script": "scrapers/scraper-nus-website.py", "fetches": True,
+     "inputs": [], "outputs": ["nus_website_data.csv"]},
+    {"name": "nus-pdf", "script": "scrapers/scraper-nus-pdf.py", "fetches": True,
+     "inputs": ["nus_website_data.csv"], "outputs": ["nus_pdf_data.csv"]},
+    {"name": "nus-course-api", "script": "scrapers/scraper-nus-course-api.py", "fetches": True,
+     "inputs": ["nus_pdf_data.csv"], "outputs": ["nus_course_details.csv"]},
+    {"name": "nus-merge", "script": "merge/scraper-nus-merge.py",
+     "sources": ["merge/merger.py", "merge/specs/nus.json"],
+     "inputs": ["nus_website_data.csv", "nus_pdf_data.csv", "nus_course_details.csv"], "outputs": ["nus_merged_data.csv"]},
+
+    # University of Copenhagen (course and course detail files come from the notebooks)
+    {"name": "ucph-website", "script": "scrapers/scraper-ucph-website.py", "fetches": True,
+     "inputs": [], "outputs": ["ucph_website_data.csv"]},
+    {"name": "ucph-pdf", "script": "scrapers/scraper-ucph-pdf.py", "fetches": True,
+     "inputs": ["ucph_website_data.csv"], "outputs": ["ucph_pdf_data.csv"]},
+    {"name": "ucph-merge", "script": "merge/scraper-ucph-merge.py",
+     "sources": ["merge/merger.py", "merge/specs/ucph.json"],
+     "inputs": ["ucph_website_data.csv", "ucph_pdf_data.csv", "ucph_course_data.csv", "ucph_course_details.csv"],
+     "outputs": ["ucph_merged_data.csv"]},
+
+    # University of Helsinki
+    {"name": "uoh-website", "script": "scrapers/scraper-uoh-website.py", "fetches": True, "browser": True,
+     "inputs": [], "outputs": ["uoh_website_data.csv"]},
+    {"name": "uoh-course", "script": "scrapers/scraper-uoh-course.py", "fetches": True, "browser": True,
+     "inputs": [], "outputs": ["uoh_course_data.csv", "uoh_course_details_data.csv"]},
+    {"name": "uoh-merge", "script": "merge/scraper-uoh-merge.py",
+     "sources": ["merge/merger.py", "merge/specs/uoh.json"],
+     "inputs": ["uoh_website_data.csv", "uoh_course_data.csv", "uoh_course_details_data.csv"],
+     "outputs": ["uoh_merged_data.csv"]},
+
+    # Universitat Politècnica de Catalunya (FIB)
+    {"name": "upcfib-website", "script": "scrapers/scraper-upcfib-website.py", "fetches": True,
+     "inputs": [], "outputs": ["upcfib_website_data.csv"]},
+    {"name": "upcfib-admission", "script": "scrapers/scraper-upcfib-admission.py", "fetches": True, "browser": True,
+     "inputs": ["upcfib_website_data.csv"], "outputs": ["upcfib_admission_data.csv"]},
+    {"name": "upcfib-course", "script": "scrapers/scraper-upcfib-course.py", "fetches": True, "browser": True,
+     "inputs": [], "outputs": ["upcfib_course_data.csv"]},
+    {"name": "upcfib-merge", "script": "merge/scraper-upcfib-merge.py",
+     "sources": ["merge/merger.py", "merge/specs/upcfib.json"],
+     "inputs": ["upcfib_website_data.csv", "upcfib_admission_data.csv", "upcfib_course_data.csv"],
+     "outputs": ["upcfib_merged_data.csv"]},
+
+    # Unified dataset
+    # Merges whichever *_merged_data.csv files exist, so universities skipped for missing inputs do not block it
+    {"name": "merge-all", "script": "merge/merge-all.py", "sources": ["merge/merger.py", "merge/dataset.py"],
+     "partial": True,
+     "inputs": ["ubc_merged_data.csv", "nus_merged_data.csv", "ucph_merged_data.csv",
+                "uoh_merged_data.csv", "upcfib_merged_data.csv"],
+     "outputs": ["master_programs_data_merged.csv", "master_programs_data/programs.csv",
+                 "master_programs_data/courses.csv", "master_programs_data/program_courses.csv"]},
+
+    # Tuition normalization (cleaned dataset comes from notebooks/data-cleaning.ipynb)
+    {"name": "clean-tuition-fees", "script": "tuition/clean-tuition-fees.py",
+     "inputs": ["master_programs_data_cleaned.csv"], "outputs": ["tuitionFees_cleaned.csv"]},
+]
+
+# Resolve step dependencies from input and output files
+def build_dependencies(steps):
+    producers = {}
+    for step in steps:
+        for output in step["outputs"]:
+            if output in producers:
+                raise ValueError(f"Output '{output}' is produced by both '{producers[output]}' and '{step['name']}'.")
+            producers[output] = step["name"]
+
+    dependencies = {}
+    for step in steps:
+        dependencies[step["name"]] = {producers[i] for i in step["inputs"] if i in producers}
+    return dependencies
+
+# Return step names in dependency order, failing on cycles
+def topological_order(steps, dependencies):
+    order = []
+    done = set()
+    visiting = set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle detected at step '{name}'.")
+        visiting.add(name)
+        for dep in sorted(dependencies[name]):
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for step in steps:
+        visit(step["name"])
+    return order
+
+# Restrict the pipeline to the selected steps and everything they depend on
+def select_steps(steps, dependencies, targets):
+    if not targets:
+        return steps
+    names = {step["name"] for step in steps}
+    unknown = [t for t in targets if t not in names]
+    if unknown:
+        raise ValueError(f"Unknown step(s): {', '.join(unknown)}")
+
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(dependencies[name])
+    return [step for step in steps if step["name"] in selected]
+
+# Hash file contents (None if the file does not exist)
+def hash_file(path):
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Fingerprint of everything a step depends on: script version, the modules and specs it uses, and input files
+def step_fingerprint(step, workdir):
+    digest = hashlib.sha256()
+    for source in [step["script"]] + step.get("sources", []):
+        digest.update(hash_file(os.path.join(REPO_DIR, source)).encode())
+    for name in sorted(step["inputs"]):
+        digest.update(name.encode())
+        digest.update((hash_file(os.path.join(workdir, name)) or "missing").encode())
+    return digest.hexdigest()
+
+# Hashes of a step's output files
+def output_hashes(step, workdir):
+    return {name: hash_file(os.path.join(workdir, name)) for name in step["outputs"]}
+
+def load_manifest(workdir):
+    path = os.path.join(workdir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Could not read manifest, rebuilding everything: {e}")
+        return {}
+
+def save_manifest(manifest, workdir):
+    path = os.path.join(workdir, MANIFEST_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+# A step is up to date if its inputs are unchanged and its outputs are untouched
+def is_up_to_date(step, workdir, manifest, fingerprint):
+    entry = manifest.get(step["name"])
+    if step.get("fetches") or not entry:
+        return False
+    if entry.get("fingerprint") != fingerprint:
+        return False
+    current = output_hashes(step, workdir)
+    return None not in current.values() and current == entry.get("outputs")
+
+# Run a single step as a subprocess (executed inside a pool worker)
+def run_step(step, workdir):
+    script = os.path.join(REPO_DIR, step["script"])
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, script],
+        cwd=workdir,
+        capture_output=True,
+        text=True
+    )
+    return {
+        "name": step["name"],
+        "returncode": result.returncode,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "seconds": time.time() - start
+    }
+
+# Run a browser step's script inside the browser worker process, with the same result as run_step()
+def run_step_in_process(step, workdir):
+    script = os.path.join(REPO_DIR, step["script"])
+    if os.path.dirname(script) not in sys.path:
+        sys.path.insert(0, os.path.dirname(script))
+    os.chdir(workdir)
+    sys.argv = [script]
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    start = time.time()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if isinstance(e.code, int) or e.code is None:
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    return {
+        "name": step["name"],
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "seconds": time.time() - start
+    }
+
+# Quit the browser worker's pooled browsers (atexit handlers do not run in pool workers)
+def close_browsers():
+    module = sys.modules.get("browser")
+    if module is not None:
+        module.close_pools()
+
+# Schedule all steps, running every step whose dependencies are done
+def run_pipeline(steps, workdir, max_workers=DEFAULT_WORKERS, dry_run=False, force=False):
+    dependencies = build_dependencies(steps)
+    order = topological_order(steps, dependencies)
+    by_name = {step["name"]: step for step in steps}
+    produced = {o for step in steps for o in step["outputs"]}
+
+    if dry_run:
+        for name in order:
+            deps = ", ".join(sorted(dependencies[name])) or "-"
+            print(f"[INFO] {name} <- {deps}")
+        return True
+
+    manifest = {} if force else load_manifest(workdir)
+    fingerprints = {}
+    done = set()
+    skipped = set()
+    failed = set()
+    # Steps skipped because external inputs (e.g. notebook outputs) are missing; not counted as failures
+    unavailable = set()
+    running = {}
+    remaining = list(order)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor, ProcessPoolExecutor(max_workers=1) as browser_executor:
+        browser_steps_run = False
+        while remaining or running:
+            for name in list(remaining):
+                deps = dependencies[name]
+                if deps & failed:
+                    print(f"[WARNING] Skipping '{name}': upstream step failed.")
+                    failed.add(name)
+                    remaining.remove(name)
+                    continue
+                # Partial steps (merge-all) run with the outputs of whichever upstream steps could run
+                blocked = deps & unavailable
+                if blocked and not by_name[name].get("partial"):
+                    print(f"[WARNING] Skipping '{name}': upstream step(s) {', '.join(sorted(blocked))} "
+                          f"skipped for missing inputs.")
+                    unavailable.add(name)
+                    remaining.remove(name)
+                    continue
+                if not deps <= done | unavailable:
+                    continue
+
+                # External inputs (not produced by any step) must already exist
+                missing = [i for i in by_name[name]["inputs"]
+                           if i not in produced and not os.path.exists(os.path.join(workdir, i))]
+                if missing:
+                    print(f"[WARNING] Skipping '{name}': missing input(s) {', '.join(missing)}.")
+                    unavailable.add(name)
+                    remaining.remove(name)
+                    continue
+
+                fingerprints[name] = step_fingerprint(by_name[name], workdir)
+                if is_up_to_date(by_name[name], workdir, manifest, fingerprints[name]):
+                    print(f"[INFO] Skipping '{name}': inputs unchanged.")
+                    done.add(name)
+                    skipped.add(name)
+                    remaining.remove(name)
+                    continue
+
+                print(f"[INFO] Starting '{name}'...")
+                if by_name[name].get("browser"):
+                    running[browser_executor.submit(run_step_in_process, by_name[name], workdir)] = name
+                    browser_steps_run = True
+                else:
+                    running[executor.submit(run_step, by_name[name], workdir)] = name
+                remaining.remove(name)
+
+            if not running:
+                # Skipped steps may have unblocked others, so check again
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Step '{name}' could not be executed: {e}")
+                    failed.add(name)
+                    continue
+
+                if result["stdout"]:
+                    print(result["stdout"].rstrip())
+                if result["returncode"] == 0:
+                    outputs = output_hashes(by_name[name], workdir)
+                    unchanged = manifest.get(name, {}).get("outputs") == outputs
+                    manifest[name] = {"fingerprint": fingerprints[name], "outputs": outputs}
+                    save_manifest(manifest, workdir)
+                    print(f"[OK] '{name}' finished in {result['seconds']:.1f}s"
+                          f"{' (output unchanged)' if unchanged else ''}")
+                    done.add(name)
+                else:
+                    if result["stderr"]:
+                        print(result["stderr"].rstrip())
+                    print(f"[ERROR] '{name}' failed with exit code {result['returncode']}")
+                    failed.add(name)
+
+        # Quit the pooled browsers once (a Ctrl-C reaches the worker and its browsers directly)
+        if browser_steps_run:
+            try:
+                browser_executor.submit(close_browsers).result()
+            except Exception as e:
+                print(f"[WARNING] Could not close the pooled browsers: {e}")
+
+    if unavailable:
+        print(f"[INFO] Skipped for missing inputs: {', '.join(sorted(unavailable))}")
+    if failed:
+        print(f"[WARNING] Pipeline finished with {len(failed)} failed or skipped step(s): {', '.join(sorted(failed))}")
+        return False
+    print(f"[OK] Pipeline finished: {len(done) - len(skipped)} step(s) run, {len(skipped)} up to date.")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Run all scrapers and merges as a dependency graph.")
+    parser.add_argument("steps", nargs="*", help="Run only these steps (and their dependencies).")
+    parser.add_argument("--workdir", default=os.getcwd(), help="Directory where CSV files are read and written.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of steps to run in parallel.")
+    parser.add_argument("--dry-run", action="store_true", help="Print the execution order without running anything.")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and rerun every step.")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record", nargs="?", const="", metavar="SET",
+                          help="Save every fetched page into a fixture set (default: today's date).")
+    fixtures.add_argument("--replay", nargs="?", const="", metavar="SET",
+                          help="Serve all pages from a fixture set instead of the network (default: latest set).")
+    args = parser.parse_args()
+
+    # Scrapers read the fixture mode from the environment (see scrapers/fixtures.py)
+    if args.record is not None or args.replay is not None:
+        os.environ["SCRAPER_FIXTURES"] = "record" if args.record is not None else "replay"
+        if args.record or args.replay:
+            os.environ["SCRAPER_FIXTURE_SET"] = args.record or args.replay
+
+    dependencies = build_dependencies(STEPS)
+    steps = select_steps(STEPS, dependencies, args.steps)
+    ok = run_pipeline(steps, os.path.abspath(args.workdir), args.workers, args.dry_run, args.force)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
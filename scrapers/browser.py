@@ -0,0 +1,260 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+import fixtures
+
+# Settings (can be overridden with environment variables)
+POOL_SIZE = int(os.environ.get("SELENIUM_POOL_SIZE", "4"))
+MAX_USES = int(os.environ.get("SELENIUM_MAX_USES", "200"))
+PAGE_LOAD_TIMEOUT = int(os.environ.get("SELENIUM_PAGE_LOAD_TIMEOUT", "60"))
+# SELENIUM_HEADLESS=off shows the browser windows (scraper-uoh-course.py used a visible window before the pool)
+HEADLESS = os.environ.get("SELENIUM_HEADLESS", "on") != "off"
+
+# Optional Selenium Grid / standalone server (it starts a new browser per session, so pools stay per process)
+REMOTE_URL = os.environ.get("SELENIUM_REMOTE_URL")
+
+# Counts pending XHR and fetch requests in window.__pendingRequests
+REQUEST_TRACKER_JS = """
+(function() {
+    if (window.__pendingRequests !== undefined) { return; }
+    window.__pendingRequests = 0;
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        window.__pendingRequests++;
+        this.addEventListener('loadend', function() { window.__pendingRequests--; });
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            window.__pendingRequests++;
+            return originalFetch.apply(this, arguments).finally(function() { window.__pendingRequests--; });
+        };
+    }
+})();
+"""
+
+def chrome_options(headless=True):
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    return options
+
+# Start a new browser (local Chrome or remote session)
+def new_driver(headless=True):
+    options = chrome_options(headless)
+    if REMOTE_URL:
+        driver = webdriver.Remote(command_executor=REMOTE_URL, options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    track_requests(driver)
+    return fixtures.instrument_driver(driver)
+
+# Install the request tracker on every page the browser loads (Chrome only)
+def track_requests(driver):
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": REQUEST_TRACKER_JS})
+    except (AttributeError, WebDriverException):
+        # Remote sessions without CDP install the tracker on demand in wait_for_network_idle()
+        pass
+
+# Check whether a browser session still responds
+def is_alive(driver):
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+# Poll probe(driver) until its value stops changing for `settle` seconds and is accepted by ready()
+def wait_until_stable(driver, probe, timeout=30, settle=0.5, poll=0.1, ready=None):
+    deadline = time.monotonic() + timeout
+    last = None
+    changed_at = time.monotonic()
+    first = True
+    while True:
+        value = probe(driver)
+        now = time.monotonic()
+        if first or value != last:
+            last = value
+            changed_at = now
+            first = False
+        elif (ready is None or ready(value)) and now - changed_at >= settle:
+            return value
+        if now >= deadline:
+            raise TimeoutException(f"Condition did not settle within {timeout}s (last value: {last})")
+        time.sleep(poll)
+
+# Wait until at least `minimum` elements match and their number stops growing
+def wait_for_count_stable(driver, selector, minimum=1, timeout=30, settle=0.5):
+    return wait_until_stable(
+        driver,
+        lambda d: len(d.find_elements(By.CSS_SELECTOR, selector)),
+        timeout=timeout,
+        settle=settle,
+        ready=lambda count: count >= minimum
+    )
+
+# Wait until the document is loaded and no XHR / fetch request has been pending for `idle` seconds.
+# Best effort: analytics beacons or long-polling can keep a page busy forever, so a timeout returns False
+def wait_for_network_idle(driver, timeout=30, idle=0.5):
+    driver.execute_script(REQUEST_TRACKER_JS)
+    try:
+        wait_until_stable(
+            driver,
+            lambda d: d.execute_script("return [document.readyState, window.__pendingRequests || 0];"),
+            timeout=timeout,
+            settle=idle,
+            ready=lambda state: state[0] == "complete" and state[1] <= 0
+        )
+    except TimeoutException as e:
+        print(f"[WARNING] Network did not become idle, continuing: {e}")
+        return False
+    return True
+
+# Wait until an element attribute has the expected value (e.g. aria-expanded flips to "true")
+def wait_for_attribute(driver, element, name, value, timeout=10):
+    WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: element.get_attribute(name) == value
+    )
+
+class DriverPool:
+    """Pool of warm browsers that are handed out to scrapers and recycled"""
+
+    def __init__(self, size=POOL_SIZE, headless=HEADLESS, max_uses=MAX_USES):
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._drivers = set()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self):
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                break
+
+            # All browsers are busy, wait for one to be released (or discarded)
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+        try:
+            driver = new_driver(self.headless)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        self._uses[id(driver)] = 0
+        self._drivers.add(driver)
+        return driver
+
+    def release(self, driver, broken=False):
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        if broken or self._closed or self._uses[id(driver)] >= self.max_uses:
+            self._discard(driver)
+            return
+
+        # Reset state so the next scraper starts from a clean browser
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        self._drivers.discard(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    @contextmanager
+    def driver(self):
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not is_alive(driver)
+            raise
+        finally:
+            self.release(driver, broken)
+
+    def map(self, fn, items):
+        """Calls fn(driver, item) for each item, spread over the pool's browsers"""
+        def run(item):
+            with self.driver() as driver:
+                return fn(driver, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def close(self):
+        """Quits all browsers, including ones that were never released"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for driver in list(self._drivers):
+            self._discard(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_pools = {}
+
+# Process-wide pool, shared by all code that borrows browsers through driver(). pipeline.py runs the
+# Selenium steps one after another in a single process, so they share this pool's warm browsers.
+def default_pool(headless=None):
+    if headless is None:
+        headless = HEADLESS
+    if headless not in _pools:
+        _pools[headless] = DriverPool(headless=headless)
+    return _pools[headless]
+
+@contextmanager
+def driver(headless=None):
+    with default_pool(headless).driver() as d:
+        yield d
+
+@atexit.register
+def close_pools():
+    for pool in _pools.values():
+        pool.close()
@@ -0,0 +1,57 @@
+import json
+import os
+import threading
+
+class Journal:
+    """Append-only JSON lines journal of completed items, used to resume interrupted crawls"""
+
+    def __init__(self, path, key):
+        self.path = path
+        self.key = key
+        self.records = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        self._truncate_partial_line()
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self.records[record[self.key]] = record
+        if self.records:
+            print(f"[INFO] Resuming from '{self.path}' with {len(self.records)} completed entries.")
+
+    # A crash can leave a partially written last line; cut it off so the next append starts on a new line
+    def _truncate_partial_line(self):
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+
+    def __contains__(self, item_key):
+        return item_key in self.records
+
+    def get(self, item_key):
+        return self.records.get(item_key)
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.records[record[self.key]] = record
+
+    def remove(self):
+        """Deletes the journal once the final output has been written"""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.records = {}
@@ -0,0 +1,155 @@
+import re
+from collections import namedtuple
+
+# Typed course records
+CourseLine = namedtuple("CourseLine", ["code", "title", "credits"])
+CourseRow = namedtuple("CourseRow", ["code", "title", "credits"])
+
+# NUS curriculum PDF: course lines and credit totals per section
+NUS_COURSE_LINE = re.compile(r"([A-Z]{2,}[0-9]{3,}[A-Z]?)\s+(.+)")
+NUS_UNITS = re.compile(r"(\d{1,3})\s*Units")
+NUS_TOTALS = [
+    re.compile(r"Essential Courses.*?(\d+)\s*Units"),
+    re.compile(r"Capstone Project.*?(\d+)\s*Units"),
+    re.compile(r"Elective Courses.*?(\d+)\s*Units")
+]
+NUS_DEFAULT_CREDITS = "4 Units"
+
+# UCPH study regulation tables: credit cells, course codes and PDF link markers
+UCPH_ECTS = re.compile(r"(\d{1,2}(?:[.,]\d{1})?)\s*ECTS", re.IGNORECASE)
+UCPH_CODE = re.compile(r"[A-Z]{2,}[0-9]{4,}[A-Z]?")
+UCPH_PDF_MARKER = re.compile(r"\(PDF\)")
+
+def scan_nus_page(text):
+    """Scans a page once; returns its course lines and the credit total of the sections found on it"""
+    courses = []
+    page_credits = 0
+
+    # Totals are searched on the whole page: a wrapped total ("... 20" / "Units") spans two lines
+    if "Units" in text:
+        for pattern in NUS_TOTALS:
+            match = pattern.search(text)
+            if match:
+                page_credits += int(match.group(1))
+
+    for line in text.split("\n"):
+        match = NUS_COURSE_LINE.match(line.strip())
+        if match:
+            course_code = match.group(1).strip()
+            course_title = match.group(2).strip()
+            unit_match = NUS_UNITS.search(course_title)
+            course_credits = f"{unit_match.group(1)} Units" if unit_match else NUS_DEFAULT_CREDITS
+            courses.append(CourseLine(course_code, course_title, course_credits))
+
+    return courses, page_credits
+
+def parse_ucph_row(row):
+    """Classifies a table row; returns a CourseRow for rows with an ECTS cell, otherwise None"""
+    if not row or len(row) < 2:
+        return None
+    cells = [cell.strip() if cell else "" for cell in row]
+
+    for idx, cell in enumerate(cells):
+        ects_match = UCPH_ECTS.search(cell)
+        if not ects_match:
+            continue
+
+        course_credits = ects_match.group(1).replace(",", ".").strip()
+        prefix = cells[:idx]
+        code_match = UCPH_CODE.search(" ".join(prefix))
+        course_code = code_match.group(0).strip() if code_match else None
+
+        title_candidate = " ".join(t for t in prefix if len(t.strip()) > 2).strip()
+        if course_code and course_code in title_candidate:
+            title_candidate = title_candidate.replace(course_code, "").strip()
+        course_title = UCPH_PDF_MARKER.sub("", title_candidate).strip()
+        return CourseRow(course_code, course_title, course_credits)
+
+    return None
+
+def scan_ucph_tables(tables):
+    """Yields a CourseRow for every table row that describes a course"""
+    for table in tables:
+        for row in table:
+            course = parse_ucph_row(row)
+            if course and course.title and course.credits:
+                yield course
+
+# Micro-benchmark: python course_lines.py [pages]
+if __name__ == "__main__":
+    import sys
+    import time
+
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    # Synthetic inputs shaped like the real PDFs
+    nus_page = "\n".join(
+        ["Master of Computing (General Track)", "Essential Courses (at least 20 Units)"]
+        + [f"CS{5000 + i} Course number {i} with a reasonably long title 4 Units" for i in range(25)]
+        + ["Some explanatory paragraph text that is not a course line." for _ in range(15)]
+        + ["Elective Courses 12 Units", "Capstone Project 8 Units"]
+    )
+    ucph_table = [
+        [f"NDAK{15000 + i}U", f"Course title number {i} (PDF)", "Block 1", f"{7.5 if i % 2 else 15} ECTS"]
+        for i in range(20)
+    ] + [["Header", "Other", "", ""], ["", None, "text", "no credits"]]
+
+    # Previous implementations, kept here only for comparison
+    def legacy_nus(text):
+        courses, credits = [], 0
+        for pattern in [r"Essential Courses.*?(\d+)\s*Units", r"Capstone Project.*?(\d+)\s*Units",
+                        r"Elective Courses.*?(\d+)\s*Units"]:
+            match = re.search(pattern, text)
+            if match:
+                credits += int(match.group(1))
+        for line in text.split("\n"):
+            match = re.match(r"^([A-Z]{2,}[0-9]{3,}[A-Z]?)\s+(.+)", line.strip())
+            if match:
+                title = match.group(2).strip()
+                unit_match = re.search(r"(\d{1,3})\s*Units", title)
+                courses.append(CourseLine(match.group(1).strip(), title,
+                                          f"{unit_match.group(1)} Units" if unit_match else "4 Units"))
+        return courses, credits
+
+    def legacy_ucph(table):
+        rows = []
+        for row in table:
+            if not row or len(row) < 2:
+                continue
+            row = [cell.strip() if cell else "" for cell in row]
+            code = title = credits = None
+            for idx, cell in enumerate(row):
+                ects_match = re.search(r"(\d{1,2}(?:[.,]\d{1})?)\s*ECTS", cell, re.IGNORECASE)
+                if ects_match:
+                    credits = ects_match.group(1).replace(",", ".").strip()
+                    code_match = re.search(r"[A-Z]{2,}[0-9]{4,}[A-Z]?", " ".join(row[:idx]))
+                    if code_match:
+                        code = code_match.group(0).strip()
+                    title_candidate = " ".join([t for t in row[:idx] if len(t.strip()) > 2]).strip()
+                    if code and code in title_candidate:
+                        title_candidate = title_candidate.replace(code, "").strip()
+                    title = re.sub(r"\(PDF\)", "", title_candidate).strip()
+                    break
+            if title and credits:
+                rows.append(CourseRow(code, title, credits))
+        return rows
+
+    wrapped_page = "Essential Courses (at least 20\nUnits)\nCS5001 Wrapped total page 4 Units"
+    assert scan_nus_page(nus_page) == legacy_nus(nus_page)
+    assert scan_nus_page(wrapped_page) == legacy_nus(wrapped_page)
+    assert list(scan_ucph_tables([ucph_table])) == legacy_ucph(ucph_table)
+
+    def bench(label, fn):
+        start = time.perf_counter()
+        for _ in range(pages):
+            fn()
+        seconds = time.perf_counter() - start
+        print(f"{label:<12} {pages} pages in {seconds * 1000:8.1f} ms ({pages / seconds:10.0f} pages/s)")
+        return seconds
+
+    legacy = bench("nus legacy", lambda: legacy_nus(nus_page))
+    engine = bench("nus engine", lambda: scan_nus_page(nus_page))
+    print(f"[OK] NUS speedup: {legacy / engine:.2f}x")
+    legacy = bench("ucph legacy", lambda: legacy_ucph(ucph_table))
+    engine = bench("ucph engine", lambda: list(scan_ucph_tables([ucph_table])))
+    print(f"[OK] UCPH speedup: {legacy / engine:.2f}x")
@@ -0,0 +1,295 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import fetch
+
+# Declarative program page specs, one JSON file per university
+SPEC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "specs")
+WORKERS = int(os.environ.get("ENGINE_WORKERS", "5"))
+
+# Shared keyword tables for fields that every university reports ([label, [phrases]], first match wins)
+KEYWORDS = {
+    # Stricter tables live in the specs (e.g. uoh.json only accepts "blended learning", not bare "blended")
+    "modality": [
+        ["On Campus", ["on campus", "in person", "face-to-face"]],
+        ["Online", ["online", "remote learning"]],
+        ["Hybrid", ["hybrid", "blended"]]
+    ],
+    "study_format": [
+        ["Full-time", ["full-time"]],
+        ["Part-time", ["part-time"]]
+    ],
+    "language": [
+        ["English", ["english"]],
+        ["Chinese", ["chinese"]],
+        ["Mandarin", ["mandarin"]],
+        ["German", ["german"]],
+        ["French", ["french"]],
+        ["Spanish", ["spanish"]]
+    ]
+}
+
+def classify(text, keywords, otherwise=None):
+    """Returns the label of the first keyword group with a phrase in the text"""
+    if isinstance(keywords, str):
+        keywords = KEYWORDS[keywords]
+    text = text.lower()
+    for label, phrases in keywords:
+        if any(phrase in text for phrase in phrases):
+            return label
+    return otherwise
+
+def extract_modality(text, otherwise="Not Specified"):
+    return classify(text, "modality", otherwise)
+
+def extract_study_format(text, otherwise="Not Specified"):
+    return classify(text, "study_format", otherwise)
+
+def extract_language(text, otherwise="Not Specified"):
+    return classify(text, "language", otherwise)
+
+def load_spec(name):
+    """Loads a spec by university name (specs/<name>.json) or from a JSON file path"""
+    path = name if name.endswith(".json") else os.path.join(SPEC_DIR, f"{name}.json")
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    spec.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    return spec
+
+def available_specs():
+    return sorted(os.path.splitext(os.path.basename(p))[0] for p in glob.glob(os.path.join(SPEC_DIR, "*.json")))
+
+# Fetch stage: static pages through the shared document store, dynamic pages through the browser pool
+def fetch_page(page, documents):
+    if isinstance(page, str):
+        page = {"url": page}
+
+    if page.get("browser"):
+        import browser
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        with browser.default_pool().driver() as driver:
+            driver.get(page["url"])
+            try:
+                if page.get("wait_for"):
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, page["wait_for"]))
+                    )
+                browser.wait_for_network_idle(driver, timeout=15)
+            except Exception as e:
+                print(f"[WARNING] Page did not finish loading: {e}")
+            raw = driver.page_source
+        return fetch.Document(raw, documents.parser)
+
+    documents.response(page["url"]).raise_for_status()
+    return documents.document(page["url"])
+
+# Parse stage: follow the rule's path from the page to the candidate elements
+def locate(rule, page):
+    elements = [page.soup]
+    for step, selector in rule.get("path", []):
+        found = []
+        for element in elements:
+            if step == "select":
+                match = element.select_one(selector)
+                found.extend([match] if match else [])
+            elif step == "select_all":
+                found.extend(element.select(selector))
+            elif step == "closest":
+                match = next((p for p in element.parents if p.name and p.css.match(selector)), None)
+                found.extend([match] if match else [])
+            elif step == "next":
+                match = next((e for e in element.find_all_next() if e.css.match(selector)), None)
+                found.extend([match] if match else [])
+            elif step == "next_sibling":
+                match = next((e for e in element.find_next_siblings() if e.css.match(selector)), None)
+                found.extend([match] if match else [])
+            else:
+                raise ValueError(f"Unknown path step '{step}'")
+        elements = found
+    return elements
+
+def candidate_values(rule, page, elements):
+    source = rule.get("source", "text")
+    for element in elements:
+        if source == "raw":
+            value = page.raw
+        elif source == "html":
+            value = element.decode_contents()
+        elif "cells" in rule:
+            value = [cell.get_text(strip=True) for cell in element.select(rule["cells"])]
+        elif element is page.soup:
+            # Whole-page text is memoized on the document and shared by all rules reading it
+            value = page.text(rule.get("separator", ""))
+        else:
+            value = element.get_text(separator=rule.get("separator", ""), strip=True)
+
+        if rule.get("lines"):
+            yield from value.split("\n")
+        else:
+            yield value
+
+def match_value(rule, value):
+    """Applies the rule's filters and matcher to one candidate; returns None if it does not match"""
+    if isinstance(value, list):
+        text = " ".join(value)
+    else:
+        text = value.lower() if rule.get("lower") else value
+        value = text
+    lowered = text.lower()
+    flags = re.IGNORECASE if rule.get("ignore_case") else 0
+
+    if "requires" in rule and not any(phrase in lowered for phrase in rule["requires"]):
+        return None
+    if "requires_all" in rule and not all(phrase in lowered for phrase in rule["requires_all"]):
+        return None
+    if "only" in rule and text not in rule["only"]:
+        return None
+
+    if "cells" in rule:
+        if "cell_count" in rule and len(value) != rule["cell_count"]:
+            return None
+        return rule["format"].format(*value) if "format" in rule else text
+    if "regex" in rule:
+        match = re.search(rule["regex"], text, flags)
+        if not match:
+            return None
+        result = match.group(1) if match.re.groups else match.group(0)
+        return rule["value"] if "value" in rule else result
+    if "findall" in rule:
+        for pattern in rule["findall"]:
+            matches = re.findall(pattern, text, flags)
+            if matches and len(matches) >= rule.get("min_count", 1):
+                matches = [m.strip(rule.get("strip", "")).strip() for m in matches]
+                return rule["format"].format(*matches) if "format" in rule else matches[0]
+        return None
+    if "patterns" in rule:
+        matched = sum(bool(re.search(p, text, flags)) for p in rule["patterns"])
+        return rule["value"] if matched >= rule.get("min_matches", len(rule["patterns"])) else None
+    if "classify" in rule:
+        label = classify(text, rule["classify"], rule.get("otherwise"))
+        return text if label is None and rule.get("keep") else label
+    if "contains" in rule:
+        return rule.get("value", text) if any(phrase.lower() in lowered for phrase in rule["contains"]) else None
+    if "value" in rule:
+        return rule["value"]
+    return text or None
+
+def finish(rule, value):
+    for old, new in rule.get("replace", []):
+        value = value.replace(old, new)
+    limit = rule.get("truncate")
+    if limit and len(value) > limit:
+        value = value[:limit] + "..."
+    return value
+
+def evaluate_rule(rule, pages, default_page):
+    # A rule without page access is a constant
+    if isinstance(rule, str):
+        return rule
+    if set(rule) <= {"value", "default"}:
+        return rule.get("value")
+
+    page = pages.get(rule.get("page", default_page))
+    if page is None:
+        return None
+
+    results = []
+    for value in candidate_values(rule, page, locate(rule, page)):
+        result = match_value(rule, value)
+        if result:
+            results.append(result)
+            if "join" not in rule:
+                break
+
+    if not results:
+        return None
+    # Replacements and truncation apply to the joined value (e.g. a 1000 character cap over all paragraphs)
+    return finish(rule, rule["join"].join(results) if "join" in rule else results[0])
+
+def evaluate_field(field, pages, default_page):
+    """A field is a rule, or a list of rules where the first one with a result wins"""
+    rules = field if isinstance(field, list) else [field]
+    for rule in rules:
+        try:
+            result = evaluate_rule(rule, pages, default_page)
+        except Exception as e:
+            print(f"[WARNING] Rule {rule} failed: {e}")
+            result = None
+        if result is None and isinstance(rule, dict) and "default" in rule:
+            result = rule["default"]
+        if result is not None:
+            return result
+    return None
+
+def extract(spec, pages):
+    """Evaluates the spec's fields; returns one row per matching variant (e.g. study format)"""
+    default_page = spec.get("default_page") or next(iter(spec["pages"]))
+    base = {name: evaluate_field(field, pages, default_page) for name, field in spec["fields"].items()}
+
+    variants = spec.get("variants")
+    if not variants:
+        return [base]
+    selected = [v for v in variants if "when" not in v or evaluate_field(v["when"], pages, default_page)]
+    if not selected and "default_variant" in spec:
+        selected = [spec["default_variant"]]
+
+    rows = []
+    for variant in selected:
+        row = dict(base)
+        row.update({name: evaluate_field(field, pages, default_page) for name, field in variant["fields"].items()})
+        rows.append(row)
+    return rows
+
+def run_spec(spec, documents):
+    """Fetch, parse, extract and write stages for one university"""
+    name = spec["name"]
+    pages = {}
+    for page_name, page in spec["pages"].items():
+        try:
+            pages[page_name] = fetch_page(page, documents)
+        except Exception as e:
+            if isinstance(page, dict) and page.get("optional"):
+                print(f"[WARNING] {name}: could not load optional page '{page_name}': {e}")
+                continue
+            print(f"[ERROR] {name}: could not load page '{page_name}': {e}")
+            return False
+
+    rows = extract(spec, pages)
+    columns = spec.get("columns") or list(spec["fields"])
+    pd.DataFrame(rows, columns=columns).to_csv(spec["output"], index=False)
+    print(f"[OK] Website data saved to '{spec['output']}' ({len(rows)} rows)")
+    return True
+
+def run(specs, max_workers=None):
+    """Runs several specs concurrently; pages shared between specs are fetched once"""
+    documents = fetch.DocumentStore()
+    urls = [page if isinstance(page, str) else page["url"]
+            for spec in specs for page in spec["pages"].values()
+            if isinstance(page, str) or not page.get("browser")]
+    documents.prefetch(urls, max_workers=fetch.POOL_SIZE)
+
+    with ThreadPoolExecutor(max_workers=max_workers or WORKERS) as executor:
+        results = list(executor.map(lambda spec: run_spec(spec, documents), specs))
+    return all(results)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract program page data from declarative university specs.")
+    parser.add_argument("specs", nargs="*", help="University spec names or JSON files (default: all specs)")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Number of universities scraped concurrently")
+    args = parser.parse_args(argv)
+
+    specs = [load_spec(name) for name in (args.specs or available_specs())]
+    if not run(specs, args.workers):
+        sys.exit(1)
+
+# Run main process
+if __name__ == "__main__":
+    main()
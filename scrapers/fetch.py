@@ -0,0 +1,527 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import requests
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import fixtures
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks (Windows): rate limits are kept per process only
+    fcntl = None
+
+# Settings (can be overridden with environment variables)
+TIMEOUT = float(os.environ.get("SCRAPER_TIMEOUT", "30"))
+RETRIES = int(os.environ.get("SCRAPER_RETRIES", "3"))
+POOL_SIZE = int(os.environ.get("SCRAPER_POOL_SIZE", "10"))
+CACHE_DIR = os.environ.get("SCRAPER_CACHE_DIR", ".http_cache")
+
+# Cache modes:
+#   "revalidate" - send conditional requests (ETag / Last-Modified) and reuse the cached body on 304
+#   "prefer"     - serve cached responses without contacting the origin (development runs)
+#   "off"        - never read or write the cache
+CACHE_MODE = os.environ.get("SCRAPER_CACHE", "revalidate")
+
+USER_AGENT = "Mozilla/5.0 (compatible; masters-thesis-scraper)"
+
+# Politeness limits for network requests (cache hits and fixture replay are not throttled):
+#   SCRAPER_RATE / SCRAPER_BURST - token bucket per host (requests per second / burst size)
+#   SCRAPER_HOST_RATES           - per-host overrides, e.g. "www.nus.edu.sg=1,www.fib.upc.edu=1"
+#   SCRAPER_HOST_CONCURRENCY     - requests in flight per host
+#   SCRAPER_HOST_CONCURRENCIES   - per-host overrides, e.g. "api.nusmods.com=16"
+#   SCRAPER_MAX_CONCURRENCY      - requests in flight across all hosts
+#   SCRAPER_ROBOTS=off           - ignore Crawl-delay / Request-rate from robots.txt
+# The per-host rate is shared by all scraper processes using the same cache directory (pipeline steps
+# running in parallel against one site) and also covers retries; the in-flight caps apply per process.
+RATE = float(os.environ.get("SCRAPER_RATE", "4"))
+BURST = int(os.environ.get("SCRAPER_BURST", "4"))
+HOST_CONCURRENCY = int(os.environ.get("SCRAPER_HOST_CONCURRENCY", "4"))
+MAX_CONCURRENCY = int(os.environ.get("SCRAPER_MAX_CONCURRENCY", "32"))
+USE_ROBOTS = os.environ.get("SCRAPER_ROBOTS", "on") != "off"
+
+# "host=value,..." settings from the environment, on top of the built-in defaults
+def host_settings(name, defaults, cast=float):
+    settings = dict(defaults)
+    for item in os.environ.get(name, "").split(","):
+        if "=" in item:
+            host, value = item.split("=", 1)
+            settings[host.strip()] = cast(value)
+    return settings
+
+# NUSMods serves static JSON files from a CDN, so it gets a higher limit (NUSMODS_CONCURRENCY defaults to 10)
+HOST_RATES = host_settings("SCRAPER_HOST_RATES", {"api.nusmods.com": 20.0})
+HOST_CONCURRENCIES = host_settings("SCRAPER_HOST_CONCURRENCIES", {"api.nusmods.com": 10}, int)
+
+# HTML parser backend for BeautifulSoup: "auto" uses lxml when it is installed, otherwise html.parser
+PARSER = os.environ.get("SCRAPER_PARSER", "auto")
+
+_session = None
+
+class ThrottledRetry(Retry):
+    """Retry that takes a token from the host's rate limit before every re-send, so retries stay within
+    the same per-host budget as first attempts (the request slot is still held by throttle())"""
+
+    netloc = None
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if _pool is not None:
+            default_port = {"http": 80, "https": 443}.get(_pool.scheme)
+            retry.netloc = _pool.host if _pool.port in (None, default_port) else f"{_pool.host}:{_pool.port}"
+        return retry
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        # Only hosts that are already throttled (not the robots.txt lookup that sets up a host's limits)
+        limits = _hosts.get(self.netloc)
+        if limits is not None and not fixtures.replaying():
+            limits.bucket.acquire()
+
+# Shared session with connection pooling and retries
+def get_session():
+    global _session
+    if _session is None:
+        retry = ThrottledRetry(
+            total=RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "HEAD"],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT})
+        _session = session
+    return _session
+
+class TokenBucket:
+    """Allows `rate` requests per second on average with bursts of up to `capacity` requests.
+    With a state_path, the bucket is kept in a locked file and shared with other processes."""
+
+    def __init__(self, rate, capacity, state_path=None):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.time()
+        self.state_path = state_path if fcntl else None
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                wait = self._take_shared() if self.state_path else self._take()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    # Takes a token; returns 0, or the seconds until the next token is available
+    def _take(self):
+        now = time.time()
+        self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def _take_shared(self):
+        with open(self.state_path, "a+", encoding="utf-8") as f:
+            # The lock is released when the file is closed
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                self.tokens, self.updated = (float(value) for value in f.read().split())
+            except ValueError:
+                # New or unreadable state: keep this process's bucket
+                pass
+            wait = self._take()
+            f.seek(0)
+            f.truncate()
+            f.write(f"{self.tokens} {self.updated}")
+        return wait
+
+class HostLimits:
+    """Rate limit and concurrency slots of one host"""
+
+    def __init__(self, rate, burst, concurrency, state_path=None):
+        self.bucket = TokenBucket(rate, burst, state_path)
+        self.slots = threading.BoundedSemaphore(concurrency)
+
+_hosts = {}
+_host_locks = {}
+_hosts_lock = threading.Lock()
+_global_slots = threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+# Crawl-delay (or Request-rate) from the host's robots.txt, in seconds between requests
+def robots_delay(scheme, host):
+    parser = RobotFileParser()
+    try:
+        response = get_session().get(f"{scheme}://{host}/robots.txt", timeout=TIMEOUT)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    parser.parse(response.text.splitlines())
+
+    delay = parser.crawl_delay(USER_AGENT)
+    request_rate = parser.request_rate(USER_AGENT)
+    if request_rate and request_rate.requests:
+        delay = max(delay or 0, request_rate.seconds / request_rate.requests)
+    return float(delay) if delay else None
+
+def host_limits(url):
+    parts = urlsplit(url)
+    with _hosts_lock:
+        if parts.netloc in _hosts:
+            return _hosts[parts.netloc]
+        host_lock = _host_locks.setdefault(parts.netloc, threading.Lock())
+
+    # robots.txt is read once per host; other hosts are not blocked meanwhile
+    with host_lock:
+        if parts.netloc in _hosts:
+            return _hosts[parts.netloc]
+        rate = HOST_RATES.get(parts.hostname, RATE)
+        burst, concurrency = BURST, HOST_CONCURRENCIES.get(parts.hostname, HOST_CONCURRENCY)
+        delay = robots_delay(parts.scheme, parts.netloc) if USE_ROBOTS else None
+        if delay:
+            print(f"[INFO] {parts.netloc} asks for {delay:g}s between requests (robots.txt)")
+            rate, burst, concurrency = min(rate, 1 / delay), 1, 1
+        _hosts[parts.netloc] = HostLimits(rate, burst, concurrency, _rate_state_path(parts.netloc))
+        return _hosts[parts.netloc]
+
+# Bucket state file of a host, shared by all scrapers with the same cache directory
+def _rate_state_path(netloc):
+    if fcntl is None:
+        return None
+    state_dir = os.path.join(CACHE_DIR, "rates")
+    try:
+        os.makedirs(state_dir, exist_ok=True)
+    except OSError:
+        return None
+    return os.path.join(state_dir, netloc.replace(":", "_"))
+
+@contextmanager
+def throttle(url):
+    """Waits for a request slot: per-host concurrency, per-host rate, then the global concurrency cap"""
+    if fixtures.replaying():
+        yield
+        return
+    limits = host_limits(url)
+    with limits.slots:
+        limits.bucket.acquire()
+        with _global_slots:
+            yield
+
+# Cache file paths for a URL
+def _cache_paths(url):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(CACHE_DIR, key[:2], key)
+    return base + ".json", base + ".body"
+
+def _load_meta(url):
+    meta_path, body_path = _cache_paths(url)
+    if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+        return None
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _load_cached(url):
+    meta = _load_meta(url)
+    if meta is None:
+        return None, None
+    try:
+        with open(_cache_paths(url)[1], "rb") as f:
+            body = f.read()
+    except OSError:
+        return None, None
+    return meta, body
+
+def _write_meta(url, meta):
+    meta_path, _ = _cache_paths(url)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+
+def _response_meta(url, response):
+    return {
+        "url": url,
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "fetched_at": time.time()
+    }
+
+def _store_cached(url, response):
+    meta_path, body_path = _cache_paths(url)
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    # Write body first so metadata never points to a partial file
+    with open(body_path + ".tmp", "wb") as f:
+        f.write(response.content)
+    os.replace(body_path + ".tmp", body_path)
+    _write_meta(url, _response_meta(url, response))
+
+def _touch_cached(url, meta):
+    meta["fetched_at"] = time.time()
+    _write_meta(url, meta)
+
+# Rebuild a requests.Response from cached metadata and body
+def _build_response(url, meta, body):
+    response = requests.Response()
+    response.status_code = meta.get("status_code", 200)
+    response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+    response._content = body
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+# Conditional request headers for a cached response
+def _validators(meta):
+    headers = {}
+    cached_headers = CaseInsensitiveDict(meta.get("headers", {}))
+    if "ETag" in cached_headers:
+        headers["If-None-Match"] = cached_headers["ETag"]
+    if "Last-Modified" in cached_headers:
+        headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+    return headers
+
+def get(url, timeout=None, headers=None, cache=None):
+    """GET a URL through the shared session and the on-disk response cache"""
+    if fixtures.replaying():
+        return get_session().get(fixtures.replay_url(url), timeout=timeout or TIMEOUT, headers=headers)
+
+    response = _get(url, timeout, headers, cache)
+    if fixtures.recording():
+        fixtures.record(url, response.content, response.status_code, response.headers)
+    return response
+
+def _get(url, timeout, headers, cache):
+    mode = cache or CACHE_MODE
+    timeout = timeout or TIMEOUT
+    session = get_session()
+
+    if mode == "off":
+        with throttle(url):
+            return session.get(url, timeout=timeout, headers=headers)
+
+    meta, body = _load_cached(url)
+    if meta is not None and mode == "prefer":
+        return _build_response(url, meta, body)
+
+    request_headers = dict(headers or {})
+    if meta is not None:
+        request_headers.update(_validators(meta))
+
+    try:
+        with throttle(url):
+            response = session.get(url, timeout=timeout, headers=request_headers)
+    except requests.RequestException as e:
+        if meta is not None:
+            print(f"[WARNING] Request for {url} failed, using cached copy: {e}")
+            return _build_response(url, meta, body)
+        raise
+
+    if response.status_code == 304 and meta is not None:
+        _touch_cached(url, meta)
+        return _build_response(url, meta, body)
+
+    response.from_cache = False
+    if response.status_code == 200:
+        _store_cached(url, response)
+    return response
+
+def download(url, path, timeout=None, cache=None, chunk_size=1 << 16):
+    """Streams a URL to a file without holding the body in memory; the cache is used like in get()"""
+    if fixtures.replaying():
+        return _download(fixtures.replay_url(url), path, timeout, "off", chunk_size)
+
+    _download(url, path, timeout, cache, chunk_size)
+    if fixtures.recording():
+        fixtures.record_file(url, path)
+    return path
+
+def _download(url, path, timeout, cache, chunk_size):
+    mode = cache or CACHE_MODE
+    timeout = timeout or TIMEOUT
+    session = get_session()
+    _, body_path = _cache_paths(url)
+
+    meta = _load_meta(url) if mode != "off" else None
+    if meta is not None and mode == "prefer":
+        shutil.copyfile(body_path, path)
+        return path
+
+    # The request slot is held until the body has been written
+    with throttle(url):
+        try:
+            response = session.get(url, timeout=timeout, headers=_validators(meta) if meta else None, stream=True)
+        except requests.RequestException as e:
+            if meta is not None:
+                print(f"[WARNING] Request for {url} failed, using cached copy: {e}")
+                shutil.copyfile(body_path, path)
+                return path
+            raise
+
+        with response:
+            if response.status_code == 304 and meta is not None:
+                _touch_cached(url, meta)
+                shutil.copyfile(body_path, path)
+                return path
+            response.raise_for_status()
+
+            with open(path, "wb") as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+
+        if mode != "off" and response.status_code == 200:
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            shutil.copyfile(path, body_path + ".tmp")
+            os.replace(body_path + ".tmp", body_path)
+            _write_meta(url, _response_meta(url, response))
+        return path
+
+def resolve_parser(parser=None):
+    parser = parser or PARSER
+    if parser != "auto":
+        return parser
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+def make_soup(markup, parser=None):
+    """Parses HTML with the configured parser backend"""
+    return BeautifulSoup(markup, resolve_parser(parser))
+
+class Document:
+    """A parsed page with memoized derived views, so the full text is only extracted once per separator"""
+
+    def __init__(self, raw, parser=None):
+        self.raw = raw
+        self.soup = make_soup(raw, parser)
+        self._views = {}
+
+    def _view(self, key, compute):
+        if key not in self._views:
+            self._views[key] = compute()
+        return self._views[key]
+
+    def text(self, separator=""):
+        return self._view(("text", separator), lambda: self.soup.get_text(separator=separator, strip=True))
+
+    def lower_text(self, separator=""):
+        return self._view(("lower_text", separator), lambda: self.text(separator).lower())
+
+    def paragraphs(self):
+        return self._view("paragraphs", lambda: [p.get_text(strip=True) for p in self.soup.find_all("p")])
+
+class DocumentStore:
+    """Per-run store that fetches and parses every URL only once"""
+
+    def __init__(self, parser=None):
+        self.parser = resolve_parser(parser)
+        self._responses = {}
+        self._documents = {}
+        self._lock = threading.Lock()
+        self._url_locks = {}
+
+    def _url_lock(self, url):
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def response(self, url):
+        with self._url_lock(url):
+            if url not in self._responses:
+                self._responses[url] = get(url)
+            return self._responses[url]
+
+    def document(self, url):
+        with self._url_lock(url):
+            if url not in self._documents:
+                if url not in self._responses:
+                    self._responses[url] = get(url)
+                self._documents[url] = Document(self._responses[url].text, self.parser)
+            return self._documents[url]
+
+    def soup(self, url):
+        return self.document(url).soup
+
+    def prefetch(self, urls, max_workers=None):
+        """Fetch and parse several URLs concurrently; failed URLs are retried on access"""
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=max_workers or len(urls) or 1) as executor:
+            futures = [executor.submit(self.document, url) for url in urls]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"[WARNING] Prefetch failed: {e}")
+
+# Parser benchmark on saved pages: python fetch.py [cache or fixture directories]
+if __name__ == "__main__":
+    import sys
+    from collections import defaultdict
+    from urllib.parse import urlparse
+
+    # Group saved HTML pages by site: cached responses (*.json + *.body) or plain *.html files
+    pages = defaultdict(list)
+    for directory in sys.argv[1:] or [CACHE_DIR]:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".html"):
+                    with open(path, encoding="utf-8", errors="replace") as f:
+                        pages[os.path.basename(root)].append(f.read())
+                elif name.endswith(".json") and os.path.exists(path[:-5] + ".body"):
+                    with open(path, encoding="utf-8") as f:
+                        meta = json.load(f)
+                    if "html" not in CaseInsensitiveDict(meta.get("headers", {})).get("Content-Type", ""):
+                        continue
+                    with open(path[:-5] + ".body", "rb") as f:
+                        pages[urlparse(meta["url"]).netloc].append(f.read().decode("utf-8", errors="replace"))
+
+    if not pages:
+        print("[WARNING] No saved HTML pages found.")
+        sys.exit(1)
+
+    backends = {"html.parser": lambda html: BeautifulSoup(html, "html.parser").get_text(" ", strip=True)}
+    try:
+        import lxml  # noqa: F401
+        backends["lxml"] = lambda html: BeautifulSoup(html, "lxml").get_text(" ", strip=True)
+    except ImportError:
+        pass
+    try:
+        from selectolax.parser import HTMLParser
+        # Raw selectolax for reference; the scrapers need the BeautifulSoup API
+        backends["selectolax (raw)"] = lambda html: HTMLParser(html).text(separator=" ", strip=True)
+    except ImportError:
+        pass
+
+    rounds = 5
+    print(f"{'site':<32} {'pages':>5} " + " ".join(f"{name:>18}" for name in backends))
+    for site, htmls in sorted(pages.items()):
+        timings = []
+        for parse in backends.values():
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for html in htmls:
+                    parse(html)
+            timings.append((time.perf_counter() - start) / rounds * 1000)
+        print(f"{site:<32} {len(htmls):>5} " + " ".join(f"{ms:>15.1f} ms" for ms in timings))
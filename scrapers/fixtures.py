@@ -0,0 +1,216 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Settings (can be overridden with environment variables)
+#   SCRAPER_FIXTURES=record - save every fetched URL and browser page source into the fixture set
+#   SCRAPER_FIXTURES=replay - serve all pages from the fixture set through a local HTTP stand-in
+MODE = os.environ.get("SCRAPER_FIXTURES", "")
+FIXTURE_DIR = os.environ.get("SCRAPER_FIXTURE_DIR", "fixtures")
+FIXTURE_SET = os.environ.get("SCRAPER_FIXTURE_SET", "")
+REPLAY_URL = os.environ.get("SCRAPER_REPLAY_URL", "")
+
+# Archive layout version, stored in each set's archive.json
+FORMAT_VERSION = 1
+
+# Headers that describe the original transfer, not the stored body
+SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+_lock = threading.Lock()
+_server = None
+
+def recording():
+    return MODE == "record"
+
+def replaying():
+    return MODE == "replay"
+
+# Fixture sets are named directories; recording defaults to today's date, replay to the latest set
+def set_dir(name=None):
+    name = name or FIXTURE_SET
+    if not name:
+        if recording():
+            name = date.today().isoformat()
+        else:
+            sets = list_sets()
+            if not sets:
+                raise FileNotFoundError(f"No fixture sets found in '{FIXTURE_DIR}'.")
+            name = sets[-1]
+    return os.path.join(FIXTURE_DIR, name)
+
+def list_sets():
+    if not os.path.isdir(FIXTURE_DIR):
+        return []
+    return sorted(d for d in os.listdir(FIXTURE_DIR) if os.path.exists(os.path.join(FIXTURE_DIR, d, "archive.json")))
+
+def _key(url):
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+def _entry_paths(directory, kind, url):
+    base = os.path.join(directory, kind, _key(url))
+    return base + ".json", base + ".body"
+
+def _ensure_archive(directory):
+    path = os.path.join(directory, "archive.json")
+    if os.path.exists(path):
+        return
+    os.makedirs(directory, exist_ok=True)
+    try:
+        # Several scrapers may record into the same set concurrently; the first one creates the manifest
+        with open(path, "x", encoding="utf-8") as f:
+            json.dump({"format": FORMAT_VERSION, "created": time.strftime("%Y-%m-%dT%H:%M:%S")}, f)
+    except FileExistsError:
+        pass
+
+def record(url, body, status=200, headers=None, kind="http"):
+    """Saves one page into the fixture set (kind "http" for raw responses, "browser" for rendered pages)"""
+    if not recording() or not url.startswith(("http://", "https://")):
+        return
+    directory = set_dir()
+    _ensure_archive(directory)
+    meta_path, body_path = _entry_paths(directory, kind, url)
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+        headers = dict(headers or {}, **{"Content-Type": "text/html; charset=utf-8"})
+    meta = {
+        "url": url,
+        "kind": kind,
+        "status_code": status,
+        "headers": {k: v for k, v in (headers or {}).items() if k.lower() not in SKIP_HEADERS},
+        "recorded_at": time.time()
+    }
+    with open(body_path + ".tmp", "wb") as f:
+        f.write(body)
+    os.replace(body_path + ".tmp", body_path)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+
+def record_file(url, path, status=200, headers=None):
+    with open(path, "rb") as f:
+        record(url, f.read(), status, headers)
+
+# Local HTTP stand-in: /<kind>/<key> serves the recorded entry
+class _Handler(BaseHTTPRequestHandler):
+    directory = None
+
+    def do_GET(self):
+        parts = self.path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in ("http", "browser"):
+            self.send_error(404)
+            return
+        base = os.path.join(self.directory, parts[0], parts[1])
+        if not os.path.exists(base + ".json"):
+            self.send_error(404, "URL not in fixture set")
+            return
+
+        with open(base + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(base + ".body", "rb") as f:
+            body = f.read()
+
+        # Rendered pages keep resolving relative links against their original URL
+        if meta["kind"] == "browser" and b"<base " not in body[:4096]:
+            base_tag = f'<base href="{meta["url"]}">'.encode("utf-8")
+            head = body.find(b"<head>")
+            body = body[:head + 6] + base_tag + body[head + 6:] if head >= 0 else base_tag + body
+
+        self.send_response(meta.get("status_code", 200))
+        for name, value in meta.get("headers", {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server(directory=None, host="127.0.0.1", port=0):
+    handler = type("FixtureHandler", (_Handler,), {"directory": directory or set_dir()})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def replay_base():
+    """Base URL of the stand-in; started in this process unless SCRAPER_REPLAY_URL points to a running one"""
+    global _server
+    if REPLAY_URL:
+        return REPLAY_URL.rstrip("/")
+    with _lock:
+        if _server is None:
+            _server = start_server()
+            print(f"[INFO] Replaying fixtures from '{_server.RequestHandlerClass.directory}'")
+    host, port = _server.server_address[:2]
+    return f"http://{host}:{port}"
+
+def replay_url(url, kind="http"):
+    if not url.startswith(("http://", "https://")):
+        return url
+    return f"{replay_base()}/{kind}/{_key(url)}"
+
+# Browser sessions: record the final DOM of every page before navigating away, or load pages from the stand-in
+def instrument_driver(driver):
+    if not (recording() or replaying()):
+        return driver
+    original_get = driver.get
+    original_quit = driver.quit
+    state = {"url": None}
+
+    def record_current():
+        if state["url"]:
+            try:
+                record(state["url"], driver.page_source, kind="browser")
+            except Exception as e:
+                print(f"[WARNING] Could not record {state['url']}: {e}")
+
+    def get(url):
+        if replaying():
+            return original_get(replay_url(url, kind="browser"))
+        record_current()
+        state["url"] = url if url.startswith(("http://", "https://")) else None
+        return original_get(url)
+
+    def quit():
+        if recording():
+            record_current()
+        return original_quit()
+
+    driver.get = get
+    driver.quit = quit
+    return driver
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and serve recorded scraper fixtures.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List fixture sets")
+    serve = subparsers.add_parser("serve", help="Serve a fixture set (for SCRAPER_REPLAY_URL)")
+    serve.add_argument("set", nargs="?", help="Fixture set (default: latest)")
+    serve.add_argument("--port", type=int, default=8800)
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for name in list_sets():
+            directory = os.path.join(FIXTURE_DIR, name)
+            counts = {kind: len([f for f in os.listdir(os.path.join(directory, kind)) if f.endswith(".json")])
+                      for kind in ("http", "browser") if os.path.isdir(os.path.join(directory, kind))}
+            print(f"{name}: " + ", ".join(f"{count} {kind}" for kind, count in counts.items()))
+        return
+
+    server = start_server(set_dir(args.set), port=args.port)
+    print(f"[INFO] Serving '{server.RequestHandlerClass.directory}' at http://127.0.0.1:{args.port} "
+          f"(set SCRAPER_FIXTURES=replay SCRAPER_REPLAY_URL=http://127.0.0.1:{args.port})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+# Run main process
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+import fetch
+
+# Fetch one module; transient errors (429/5xx) are retried with backoff by the shared session
+def _fetch_module(base_url, code):
+    try:
+        response = fetch.get(f"{base_url}{code}.json")
+    except Exception as e:
+        return code, None, str(e)
+    if response.status_code != 200:
+        return code, None, f"Status Code: {response.status_code}"
+    return code, response.json(), None
+
+def fetch_modules(codes, base_url, concurrency=fetch.POOL_SIZE):
+    """Fetches module JSON for all unique codes concurrently; returns {code: data} and {code: error}"""
+    unique_codes = list(dict.fromkeys(c for c in codes if isinstance(c, str) and c))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda code: _fetch_module(base_url, code), unique_codes))
+
+    modules = {code: data for code, data, error in results if data is not None}
+    errors = {code: error for code, data, error in results if data is None}
+    return modules, errors
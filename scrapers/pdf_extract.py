@@ -0,0 +1,129 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import pdfplumber
+
+# Settings (can be overridden with environment variables)
+WORKERS = int(os.environ.get("PDF_WORKERS", str(os.cpu_count() or 1)))
+MIN_PAGES_PER_WORKER = 8
+# Pages per task when streaming; at most two tasks per worker are in flight
+CHUNK_PAGES = int(os.environ.get("PDF_CHUNK_PAGES", "16"))
+
+# Parsed pages are cached per document hash; bump the version when extract_page() changes
+CACHE_DIR = os.environ.get("PDF_CACHE_DIR", ".pdf_cache")
+CACHE_VERSION = f"v1-pdfplumber{pdfplumber.__version__}"
+USE_CACHE = os.environ.get("PDF_CACHE", "on") != "off"
+
+# Extract text and tables from one page, reusing the page's parsed layout objects for both
+def extract_page(page, tables=True):
+    text = page.extract_text() or ""
+    page_tables = page.extract_tables() if tables else []
+    # Drop the cached layout objects, they are not needed anymore
+    page.close()
+    return {"page": page.page_number, "text": text, "tables": page_tables}
+
+# Open the PDF memory-mapped, so pages are read from the OS page cache instead of a Python buffer
+def _iter_range(path, start, stop, tables):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        with pdfplumber.open(data) as pdf:
+            for i in range(start, stop):
+                yield extract_page(pdf.pages[i], tables)
+
+# Worker: process a contiguous range of pages
+def _extract_range(path, start, stop, tables):
+    return list(_iter_range(path, start, stop, tables))
+
+def _page_count(path):
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+# Chunks of pages extracted in parallel, yielded in page order with a bounded number of chunks in memory
+def _iter_parallel(path, page_count, tables, workers):
+    bounds = list(range(0, page_count, CHUNK_PAGES)) + [page_count]
+    ranges = deque(zip(bounds[:-1], bounds[1:]))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while ranges or pending:
+            while ranges and len(pending) < 2 * workers:
+                start, stop = ranges.popleft()
+                pending.append(executor.submit(_extract_range, path, start, stop, tables))
+            yield from pending.popleft().result()
+
+# SHA-256 of the PDF bytes (source is bytes or a path)
+def document_hash(source):
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray)):
+        digest.update(source)
+    else:
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+def _cache_path(doc_hash, tables):
+    return os.path.join(CACHE_DIR, f"{doc_hash}.{CACHE_VERSION}.{'tables' if tables else 'text'}.jsonl")
+
+# Cached pages (one JSON line per page); a cache with tables also serves text-only requests
+def _find_cache(doc_hash, tables):
+    candidates = [_cache_path(doc_hash, True)] + ([] if tables else [_cache_path(doc_hash, False)])
+    return next((path for path in candidates if os.path.exists(path)), None)
+
+def extract_pages(source, tables=True, workers=None, use_cache=None):
+    """Extracts text and tables of every page; source is a path, bytes or a BytesIO object"""
+    if isinstance(source, BytesIO):
+        source = source.getvalue()
+    if not isinstance(source, (bytes, bytearray)):
+        return list(iter_pages(source, tables, workers, use_cache))
+
+    # Workers open the PDF by path, so buffered PDFs are spilled to a temporary file
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(source)
+        tmp_path = f.name
+    try:
+        return list(iter_pages(tmp_path, tables, workers, use_cache))
+    finally:
+        os.remove(tmp_path)
+
+def iter_pages(path, tables=True, workers=None, use_cache=None):
+    """Yields the extracted pages of a PDF file in order, holding only a few chunks of pages in memory"""
+    use_cache = USE_CACHE if use_cache is None else use_cache
+    if use_cache:
+        doc_hash = document_hash(path)
+        cache_path = _find_cache(doc_hash, tables)
+        if cache_path:
+            print(f"[INFO] Using parsed PDF from cache ({doc_hash[:12]})")
+            with open(cache_path, encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+            return
+
+    page_count = _page_count(path)
+    workers = max(1, min(workers or WORKERS, page_count // MIN_PAGES_PER_WORKER))
+    if workers == 1:
+        pages = _iter_range(path, 0, page_count, tables)
+    else:
+        pages = _iter_parallel(path, page_count, tables, workers)
+
+    if not use_cache:
+        yield from pages
+        return
+
+    # The cache is written while pages stream through and only published once the document is complete
+    cache_path = _cache_path(doc_hash, tables)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    complete = False
+    try:
+        with open(cache_path + ".tmp", "w", encoding="utf-8") as f:
+            for page in pages:
+                f.write(json.dumps(page, ensure_ascii=False) + "\n")
+                yield page
+        os.replace(cache_path + ".tmp", cache_path)
+        complete = True
+    finally:
+        if not complete and os.path.exists(cache_path + ".tmp"):
+            os.remove(cache_path + ".tmp")
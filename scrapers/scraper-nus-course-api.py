@@ -1,18 +1,18 @@
-import requests
 import pandas as pd
+import argparse
 import csv
-import re
+import json
+import os
+import fetch
+import nusmods
 
 # Input and output
 INPUT_CSV = "nus_pdf_data.csv"
 OUTPUT_CSV = "nus_course_details.csv"
-API_BASE_URL = "https://api.nusmods.com/v2/2023-2024/modules/"
-
-# Read course codes and titles
-df_courses = pd.read_csv(INPUT_CSV)
-
-# Prepare list for output
-output_data = []
+API_BASE_URL = os.environ.get("NUSMODS_API_BASE_URL", "https://api.nusmods.com/v2/2023-2024/modules/")
+CONCURRENCY = int(os.environ.get("NUSMODS_CONCURRENCY", "10"))
+BULK_URL = "https://api.nusmods.com/v2/2023-2024/moduleInfo.json"
+OUTPUT_COLUMNS = ["Course Code", "Course Title", "Course Credits", "Course Description", "Prerequisites"]
 
 # Helper function to process workload
 def process_workload(workload):
@@ -28,16 +28,59 @@ def process_workload(workload):
     else:
         return "Unknown"
 
-# Scrape course details from API
-for index, row in df_courses.iterrows():
-    course_code = row["Course Code"]
-    course_title = row["Course Title"]
-    
-    url = f"{API_BASE_URL}{course_code}.json"
-    response = requests.get(url)
+# Load the full-year module dump (URL or local file) into a frame indexed by module code
+def load_module_index(source):
+    if source.startswith("http://") or source.startswith("https://"):
+        response = fetch.get(source)
+        response.raise_for_status()
+        modules = response.json()
+    else:
+        with open(source, encoding="utf-8") as f:
+            modules = json.load(f)
+
+    index = pd.DataFrame(modules)
+    for col in ["description", "prerequisite"]:
+        if col not in index.columns:
+            index[col] = None
+    # Workloads keep their raw JSON values (int, float, list or missing), as in the per-module path
+    index["workload"] = pd.Series([module.get("workload") for module in modules], index=index.index, dtype=object)
+    index = index.drop_duplicates(subset=["moduleCode"]).set_index("moduleCode")
+    print(f"[INFO] Loaded {len(index)} modules from '{source}'")
+    return index[["description", "prerequisite", "workload"]]
+
+# Resolve all courses from the module index in one join
+def resolve_from_index(df_courses, index):
+    merged = df_courses[["Course Code", "Course Title"]].join(index, on="Course Code", how="left")
+    found = merged["Course Code"].isin(index.index)
+
+    for course_code in merged.loc[~found, "Course Code"]:
+        print(f"[ERROR] Failed to retrieve data for {course_code}. Not in module index.")
+
+    merged = merged[found]
+    workload = merged["workload"].where(merged["workload"].notna(), None)
+    result = pd.DataFrame({
+        "Course Code": merged["Course Code"],
+        "Course Title": merged["Course Title"],
+        "Course Credits": workload.map(process_workload),
+        "Course Description": merged["description"].fillna("Not Specified").astype(str).str.strip(),
+        "Prerequisites": merged["prerequisite"].fillna("Not Specified").astype(str).str.strip()
+    })
+    print(f"[OK] Resolved {len(result)} courses from module index")
+    return result.to_dict("records")
 
-    if response.status_code == 200:
-        data = response.json()
+# Fetch every module separately from the API
+def resolve_from_api(df_courses):
+    modules, errors = nusmods.fetch_modules(df_courses["Course Code"].tolist(), API_BASE_URL, concurrency=CONCURRENCY)
+
+    output_data = []
+    for index, row in df_courses.iterrows():
+        course_code = row["Course Code"]
+        course_title = row["Course Title"]
+        data = modules.get(course_code)
+
+        if data is None:
+            print(f"[ERROR] Failed to retrieve data for {course_code}. {errors.get(course_code, '')}")
+            continue
 
         course_description = data.get("description", "Not Specified").strip()
         prerequisites = data.get("prerequisite", "Not Specified").strip()
@@ -53,13 +96,31 @@ for index, row in df_courses.iterrows():
         })
 
         print(f"[OK] Extracted data for {course_code}")
+    return output_data
+
+# Main process: Resolve course details and save to CSV
+def main():
+    parser = argparse.ArgumentParser(description="Fetch NUS course details from NUSMods.")
+    parser.add_argument("--bulk", nargs="?", const=BULK_URL, default=os.environ.get("NUSMODS_BULK_SOURCE"),
+                        help="Resolve all courses from a full-year moduleInfo.json (URL or local file).")
+    args = parser.parse_args()
+
+    # Read course codes and titles (one row per course code)
+    df_courses = pd.read_csv(INPUT_CSV)
+    df_courses = df_courses.drop_duplicates(subset=["Course Code"])
+
+    if args.bulk:
+        output_data = resolve_from_index(df_courses, load_module_index(args.bulk))
     else:
-        print(f"[ERROR] Failed to retrieve data for {course_code}. Status Code: {response.status_code}")
+        output_data = resolve_from_api(df_courses)
+
+    # Save to CSV
+    with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(output_data)
 
-# Save to CSV
-with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
-    writer = csv.DictWriter(f, fieldnames=["Course Code", "Course Title", "Course Credits", "Course Description", "Prerequisites"])
-    writer.writeheader()
-    writer.writerows(output_data)
+    print(f"[OK] Saved {len(output_data)} courses to '{OUTPUT_CSV}'")
 
-print(f"[OK] Saved {len(output_data)} courses to '{OUTPUT_CSV}'")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
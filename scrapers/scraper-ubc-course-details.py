@@ -1,17 +1,16 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
 import pandas as pd
 import re
 
 # Input
 URL = "https://vancouver.calendar.ubc.ca/course-descriptions/subject/cpscv"
 
-response = requests.get(URL)
+response = fetch.get(URL)
 if response.status_code != 200:
     print(f"[ERROR] Failed to fetch the page: Status code {response.status_code}")
     exit()
 
-soup = BeautifulSoup(response.text, "html.parser")
+soup = fetch.make_soup(response.text)
 courses = []
 
 # Match entries
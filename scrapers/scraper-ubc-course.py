@@ -1,5 +1,4 @@
-import requests
-from bs4 import BeautifulSoup
+import fetch
 import csv
 import pandas as pd
 
@@ -18,8 +17,8 @@ courses = []
 
 # Extract from each page
 for url in URLS:
-    res = requests.get(url)
-    soup = BeautifulSoup(res.content, "html.parser")
+    res = fetch.get(url)
+    soup = fetch.make_soup(res.content)
 
     # Find all course tables
     for table in soup.find_all("table"):
@@ -1,14 +1,31 @@
-import pdfplumber
 import pandas as pd
+import csv
 import re
 import os
-import requests
-from io import BytesIO
+import tempfile
+import fetch
+import pdf_extract
+import course_lines
 
 # Input and output
 PDF_URL = "https://science.ku.dk/studerende/studieordninger/erhvervskandidat/msc_computer_science_sto_erhvervska.pdf"
 WEBSITE_CSV = "ucph_website_data.csv"
 OUTPUT_CSV = "ucph_pdf_data.csv"
+OUTPUT_COLUMNS = [
+    "Program ID", "Course Code", "Course Title", "Course Credits", "Institution", "Language", "Modality",
+    "Degree Type", "Specialization", "Academic Admission Requirements", "Language Admission Requirements",
+    "Total Credits"
+]
+
+# Document-level fields: keywords, the admission requirements section and the first credit figure
+FIELD_KEYWORDS = [
+    "master of science", "msc", "english", "danish", "online", "remote", "distance", "blended", "hybrid",
+    "language requirement", "ielts", "toefl", "proficiency"
+]
+LANGUAGE_REQUIREMENT_KEYWORDS = ["english", "language requirement", "ielts", "toefl", "proficiency"]
+REQUIREMENTS_START = re.compile(r"4\.2 Other Bachelor’s degrees", re.IGNORECASE)
+REQUIREMENTS_END = re.compile(r"4\.3 Other applicants", re.IGNORECASE)
+TOTAL_CREDITS = re.compile(r"(\d{2,3})\s*ECTS", re.IGNORECASE)
 
 # Load program ID from website scraper output
 def load_program_id(csv_file):
@@ -17,21 +34,55 @@ def load_program_id(csv_file):
     df = pd.read_csv(csv_file)
     return df.iloc[0]["Program ID"]
 
+class DocumentScanner:
+    """Collects the document-level fields page by page, so the full text is never held in memory"""
+
+    def __init__(self):
+        self.keywords = set()
+        self.requirements_start = False
+        self.requirements_found = False
+        self.total_credits = None
+        self._last_line = ""
+
+    def feed(self, text):
+        if not text:
+            return
+        lowered = text.lower()
+        self.keywords.update(kw for kw in FIELD_KEYWORDS if kw in lowered)
+
+        # The requirements section may start and end on different pages
+        if not self.requirements_found:
+            offset = 0
+            if not self.requirements_start:
+                match = REQUIREMENTS_START.search(text)
+                if match:
+                    self.requirements_start = True
+                    offset = match.end() + 1
+            if self.requirements_start and REQUIREMENTS_END.search(text, offset):
+                self.requirements_found = True
+
+        # A credit figure at the end of a page may have its unit on the next one
+        if self.total_credits is None:
+            match = TOTAL_CREDITS.search(self._last_line + "\n" + text)
+            if match:
+                self.total_credits = f"{match.group(1)} ECTS"
+        self._last_line = text.rsplit("\n", 1)[-1]
+
 # Extract degree type, language and modality
-def extract_structured_fields(text):
-    text = text.lower()
-    degree_type = "MSc" if "master of science" in text or "msc" in text else "Not specified"
+def extract_structured_fields(document):
+    keywords = document.keywords
+    degree_type = "MSc" if "master of science" in keywords or "msc" in keywords else "Not specified"
 
     language = []
-    if "english" in text:
+    if "english" in keywords:
         language.append("English")
-    if "danish" in text:
+    if "danish" in keywords:
         language.append("Danish")
     language = ", ".join(sorted(set(language))) if language else "Not specified"
 
-    if "online" in text or "remote" in text or "distance" in text:
+    if "online" in keywords or "remote" in keywords or "distance" in keywords:
         modality = "Online"
-    elif "blended" in text or "hybrid" in text:
+    elif "blended" in keywords or "hybrid" in keywords:
         modality = "Hybrid"
     else:
         modality = "On Campus"
@@ -39,9 +90,8 @@ def extract_structured_fields(text):
     return degree_type, language, modality
 
 # Return academic requirements if expected section is found
-def extract_academic_requirements_block(text):
-    match = re.search(r"4\.2 Other Bachelor’s degrees(.+?)4\.3 Other applicants", text, re.DOTALL | re.IGNORECASE)
-    if match:
+def extract_academic_requirements_block(document):
+    if document.requirements_found:
         return (
             "Bachelor’s degree with 45 ECTS in Computer Science:\n"
             "- 7.5 ECTS in programming (2 paradigms)\n"
@@ -52,82 +102,65 @@ def extract_academic_requirements_block(text):
     return "No structured academic requirements section found."
 
 # Identify and normalize language requirement
-def extract_language_requirement_normalized(text):
-    for line in text.split("\n"):
-        if any(kw in line.lower() for kw in ["english", "language requirement", "ielts", "toefl", "proficiency"]):
-            return "Proof of English proficiency is required (see English language requirements)."
+def extract_language_requirement_normalized(document):
+    if any(kw in document.keywords for kw in LANGUAGE_REQUIREMENT_KEYWORDS):
+        return "Proof of English proficiency is required (see English language requirements)."
     return "Not available"
 
 # Extract total credits
-def extract_total_credits(text):
-    match = re.search(r"(\d{2,3})\s*ECTS", text, re.IGNORECASE)
-    if match:
-        return f"{match.group(1)} ECTS"
-    return "Not available"
+def extract_total_credits(document):
+    return document.total_credits or "Not available"
 
 # Main process: Download PDF, extract metadata and course modules and save to CSV
 def main():
-    response = requests.get(PDF_URL)
-    if response.status_code != 200:
-        print("[ERROR] Could not download PDF.")
-        return
-
     program_id = load_program_id(WEBSITE_CSV)
-    pdf_file = BytesIO(response.content)
-    modules = []
     institution = "University of Copenhagen"
-
-    with pdfplumber.open(pdf_file) as pdf:
-        all_text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
-        degree_type, language, modality = extract_structured_fields(all_text)
-        academic_requirements = extract_academic_requirements_block(all_text)
-        language_requirements = extract_language_requirement_normalized(all_text)
-        total_credits = extract_total_credits(all_text)
-
-        for page in pdf.pages:
-            tables = page.extract_tables()
-            for table in tables:
-                for row in table:
-                    if not row or len(row) < 2:
-                        continue
-                    row = [cell.strip() if cell else "" for cell in row]
-                    course_code = None
-                    course_title = None
-                    course_credits = None
-
-                    for idx, cell in enumerate(row):
-                        ects_match = re.search(r"(\d{1,2}(?:[.,]\d{1})?)\s*ECTS", cell, re.IGNORECASE)
-                        if ects_match:
-                            course_credits = ects_match.group(1).replace(",", ".").strip()
-                            code_match = re.search(r"[A-Z]{2,}[0-9]{4,}[A-Z]?", " ".join(row[:idx]))
-                            if code_match:
-                                course_code = code_match.group(0).strip()
-                            title_parts = [t for t in row[:idx] if len(t.strip()) > 2]
-                            title_candidate = " ".join(title_parts).strip()
-                            if course_code and course_code in title_candidate:
-                                title_candidate = title_candidate.replace(course_code, "").strip()
-                            course_title = re.sub(r"\(PDF\)", "", title_candidate).strip()
-                            break
-
-                    if course_title and course_credits:
-                        modules.append({
-                            "Program ID": program_id,
-                            "Course Code": course_code,
-                            "Course Title": course_title,
-                            "Course Credits": course_credits,
-                            "Institution": institution,
-                            "Language": language,
-                            "Modality": modality,
-                            "Degree Type": degree_type,
-                            "Specialization": None,
-                            "Academic Admission Requirements": academic_requirements,
-                            "Language Admission Requirements": language_requirements,
-                            "Total Credits": total_credits
-                        })
-
-    df = pd.DataFrame(modules)
-    df.to_csv(OUTPUT_CSV, index=False)
-    print(f"[OK] Saved {len(modules)} courses to '{OUTPUT_CSV}'")
+    document = DocumentScanner()
+    course_count = 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        try:
+            pdf_path = fetch.download(PDF_URL, os.path.join(tmp_dir, "study_regulations.pdf"))
+        except Exception as e:
+            print(f"[ERROR] Could not download PDF: {e}")
+            return
+
+        # Pages are processed as they are extracted; course rows are spooled to disk until the
+        # document-level fields are known
+        with tempfile.TemporaryFile("w+", newline="", encoding="utf-8") as spool:
+            spool_writer = csv.writer(spool)
+            for page in pdf_extract.iter_pages(pdf_path):
+                document.feed(page["text"])
+                for course in course_lines.scan_ucph_tables(page["tables"]):
+                    spool_writer.writerow(course)
+                    course_count += 1
+
+            degree_type, language, modality = extract_structured_fields(document)
+            academic_requirements = extract_academic_requirements_block(document)
+            language_requirements = extract_language_requirement_normalized(document)
+            total_credits = extract_total_credits(document)
+
+            spool.seek(0)
+            with open(OUTPUT_CSV, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=OUTPUT_COLUMNS, lineterminator="\n")
+                writer.writeheader()
+                for course_code, course_title, course_credits in csv.reader(spool):
+                    writer.writerow({
+                        "Program ID": program_id,
+                        "Course Code": course_code,
+                        "Course Title": course_title,
+                        "Course Credits": course_credits,
+                        "Institution": institution,
+                        "Language": language,
+                        "Modality": modality,
+                        "Degree Type": degree_type,
+                        "Specialization": None,
+                        "Academic Admission Requirements": academic_requirements,
+                        "Language Admission Requirements": language_requirements,
+                        "Total Credits": total_credits
+                    })
+
+    print(f"[OK] Saved {course_count} courses to '{OUTPUT_CSV}'")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,14 +1,29 @@
-import time
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from selenium import webdriver
+import browser
+import checkpoint
+import fetch
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Selectors
+COOKIE_DIALOG_ID = "CybotCookiebotDialog"
+EXPAND_BUTTON_SELECTOR = "button.button--action.theme-transparent[aria-expanded='false']"
+COURSE_ITEM_SELECTOR = "li.rootModule__courseItem___8qM7s"
+
 # Input and output
 COURSE_PAGE_URL = "https://studies.helsinki.fi/degree-structure/study-module/otm-eca7b5e8-26d8-41ab-88ca-47aa95c365cf?cpId=hy-lv-75"
-OUTPUT_CSV = "uoh_course_data.csv"
+COURSE_CSV = "uoh_course_data.csv"
+DETAILS_CSV = "uoh_course_details_data.csv"
+JOURNAL_FILE = "uoh_course_details_data.journal.jsonl"
+
+# Number of parallel HTTP fetches when course pages are server-rendered (browsers: SELENIUM_POOL_SIZE),
+# and attempts per course page
+WORKERS = int(os.environ.get("UOH_DETAIL_WORKERS", "4"))
+ATTEMPTS = 2
 
 def handle_cookies(driver):
     try:
@@ -17,22 +32,21 @@ def handle_cookies(driver):
         )
         decline_button.click()
         print("[INFO] Clicked 'Use necessary cookies only'.")
-        time.sleep(2)
+        WebDriverWait(driver, 10).until(EC.invisibility_of_element_located((By.ID, COOKIE_DIALOG_ID)))
     except:
         print("[INFO] No cookie consent banner detected or already handled.")
 
 def expand_all_elements(driver):
     try:
-        expand_buttons = driver.find_elements(By.CSS_SELECTOR, "button.button--action.theme-transparent[aria-expanded='false']")
+        expand_buttons = driver.find_elements(By.CSS_SELECTOR, EXPAND_BUTTON_SELECTOR)
         print(f"[INFO] Found {len(expand_buttons)} sections to expand.")
 
         for idx, button in enumerate(expand_buttons):
             try:
-                driver.execute_script("arguments[0].scrollIntoView({ behavior: 'smooth', block: 'center' });", button)
-                time.sleep(0.5)
+                driver.execute_script("arguments[0].scrollIntoView({ block: 'center' });", button)
                 driver.execute_script("arguments[0].click();", button)
+                browser.wait_for_attribute(driver, button, "aria-expanded", "true")
                 print(f"[INFO] Expanded section {idx + 1} of {len(expand_buttons)}.")
-                time.sleep(1)
             except Exception as e:
                 print(f"[WARNING] Could not expand section {idx + 1}: {e}")
                 continue
@@ -42,7 +56,7 @@ def expand_all_elements(driver):
 def extract_course_data(driver):
     course_data = []
     try:
-        course_items = driver.find_elements(By.CSS_SELECTOR, "li.rootModule__courseItem___8qM7s")
+        course_items = driver.find_elements(By.CSS_SELECTOR, COURSE_ITEM_SELECTOR)
         for item in course_items:
             try:
                 link_element = item.find_element(By.CSS_SELECTOR, "a.rootModule__link___1BtmW")
@@ -60,12 +74,12 @@ def extract_course_data(driver):
                     course_code = ""
                     course_title = course_text.strip()
 
-                if course_title and course_credits:
-                    course_data.append({
-                        "Course Code": course_code,
-                        "Course Title": course_title,
-                        "Course Credits": course_credits
-                    })
+                course_data.append({
+                    "Course URL": course_url,
+                    "Course Code": course_code,
+                    "Course Title": course_title,
+                    "Course Credits": course_credits
+                })
             except Exception as e:
                 print(f"[WARNING] Skipped a course item due to extraction issue: {e}")
                 continue
@@ -73,12 +87,116 @@ def extract_course_data(driver):
         print(f"[ERROR] Problem during course data extraction: {e}")
     return course_data
 
-def main():
-    options = Options()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
+# Extract course description and prerequisites from course detail page
+def extract_course_details(driver):
+    course_description = ""
+    prerequisites = ""
+
+    try:
+        headings = driver.find_elements(By.TAG_NAME, "h3")
+        for heading in headings:
+            heading_text = heading.text.strip().lower()
+            if heading_text == "content":
+                try:
+                    next_element = heading.find_element(By.XPATH, "following-sibling::*[1]")
+                    course_description = next_element.text.strip()
+                except Exception as e:
+                    print(f"[WARNING] Could not extract Content text: {e}")
+            elif heading_text == "prerequisites":
+                try:
+                    next_element = heading.find_element(By.XPATH, "following-sibling::*[1]")
+                    prerequisites = next_element.text.strip()
+                except Exception as e:
+                    print(f"[WARNING] Could not extract Prerequisites text: {e}")
+    except Exception as e:
+        print(f"[WARNING] Failed to extract details on course page: {e}")
+
+    return course_description, prerequisites
+
+# Same extraction on server-rendered HTML (plain HTTP path)
+def extract_course_details_html(html):
+    course_description = ""
+    prerequisites = ""
+
+    soup = fetch.make_soup(html)
+    for heading in soup.find_all("h3"):
+        heading_text = heading.get_text(strip=True).lower()
+        next_element = heading.find_next_sibling()
+        if heading_text == "content" and next_element:
+            course_description = next_element.get_text(separator="\n", strip=True)
+        elif heading_text == "prerequisites" and next_element:
+            prerequisites = next_element.get_text(separator="\n", strip=True)
+
+    return course_description, prerequisites
+
+# Check whether course pages are server-rendered, so they can be fetched without a browser
+def is_server_rendered(course_url):
+    try:
+        response = fetch.get(course_url)
+        if response.status_code != 200:
+            return False
+        course_description, prerequisites = extract_course_details_html(response.text)
+        return bool(course_description or prerequisites)
+    except Exception:
+        return False
+
+def course_record(course, course_description, prerequisites):
+    return {
+        "Course URL": course["Course URL"],
+        "Course Code": course["Course Code"],
+        "Course Title": course["Course Title"],
+        "Course Credits": course["Course Credits"],
+        "Course Description": course_description,
+        "Prerequisites": prerequisites
+    }
+
+# Visit each course page in parallel and extract details, skipping pages already in the journal
+def crawl_course_details(pool, course_links, journal):
+    pending = [course for course in course_links if course["Course URL"] not in journal]
+    total = len(pending)
+    print(f"[INFO] {len(course_links) - total} courses already done, {total} to crawl.")
+
+    use_http = bool(pending) and is_server_rendered(pending[0]["Course URL"])
+    if use_http:
+        print("[INFO] Course pages are server-rendered, fetching them without a browser.")
+
+    progress = {"count": 0}
+    lock = threading.Lock()
+
+    def crawl(driver, course):
+        for attempt in range(1, ATTEMPTS + 1):
+            try:
+                if use_http:
+                    response = fetch.get(course["Course URL"])
+                    response.raise_for_status()
+                    course_description, prerequisites = extract_course_details_html(response.text)
+                else:
+                    driver.get(course["Course URL"])
+                    WebDriverWait(driver, 20).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "h3"))
+                    )
+                    course_description, prerequisites = extract_course_details(driver)
+
+                journal.append(course_record(course, course_description, prerequisites))
+                with lock:
+                    progress["count"] += 1
+                    print(f"[INFO] ({progress['count']}/{total}) Extracted course: {course['Course Code']}")
+                return
+            except Exception as e:
+                print(f"[WARNING] Attempt {attempt} failed for {course['Course Code']}: {e}")
+        print(f"[WARNING] Could not extract course details for {course['Course Code']}")
+
+    if use_http:
+        # No browser needed: a thread pool over the shared HTTP session is enough
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            list(executor.map(lambda course: crawl(None, course), pending))
+    else:
+        pool.map(crawl, pending)
 
-    driver = webdriver.Chrome(options=options)
+    return [journal.get(course["Course URL"]) for course in course_links if course["Course URL"] in journal]
+
+# Load the module page, expand all sections and extract the course list
+def load_course_data(driver):
     driver.get(COURSE_PAGE_URL)
 
     try:
@@ -88,7 +206,6 @@ def main():
         # Hard refresh page after cookie acceptance
         driver.refresh()
         print("[INFO] Page reloaded after cookie handling.")
-        time.sleep(5)
 
         # Wait for page structure
         WebDriverWait(driver, 30).until(
@@ -96,53 +213,72 @@ def main():
         )
         print("[INFO] Basic page structure loaded after refresh.")
 
-        time.sleep(2)
-
         # Scroll to first module section title
         first_section = WebDriverWait(driver, 15).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "span.rootModule__accordionName___1GiB5"))
         )
-        driver.execute_script("arguments[0].scrollIntoView({ behavior: 'smooth', block: 'center' });", first_section)
+        driver.execute_script("arguments[0].scrollIntoView({ block: 'center' });", first_section)
         print("[INFO] Scrolled to first section to trigger lazy loading.")
 
-        time.sleep(5)  # Allow modules to load after scroll
-
-        # Wait for at least one expandable module button to appear
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "button.button--action.theme-transparent[aria-expanded='false']"))
-        )
+        # Wait until the lazily loaded modules have arrived and stopped growing
+        browser.wait_for_count_stable(driver, EXPAND_BUTTON_SELECTOR, timeout=30)
+        browser.wait_for_network_idle(driver)
         print("[INFO] Expandable sections detected, modules are loaded.")
 
-        time.sleep(2)
-
         # Expand all sections
         expand_all_elements(driver)
         print("[INFO] Expand actions completed.")
 
-        time.sleep(5)  # Allow courses to load after expand
-
-        # Wait for course list items
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "li.rootModule__courseItem___8qM7s"))
-        )
+        # Wait until the course lists of all expanded sections have loaded
+        browser.wait_for_network_idle(driver)
+        browser.wait_for_count_stable(driver, COURSE_ITEM_SELECTOR, timeout=30)
         print("[INFO] Course list items are now visible.")
 
     except Exception as e:
         print(f"[ERROR] Problem during page loading or expansion: {e}")
-        driver.quit()
-        return
+        return None
 
-    # Extract course data and save to CSV
-    course_data = extract_course_data(driver)
-    driver.quit()
+    return extract_course_data(driver)
 
-    if course_data:
-        df = pd.DataFrame(course_data)
-        df.to_csv(OUTPUT_CSV, index=False)
-        print(f"[OK] Course data saved to '{OUTPUT_CSV}' with {len(course_data)} entries.")
-    else:
+# Main process: Expand the module page once, then write the course list and crawl course details
+def main():
+    journal = checkpoint.Journal(JOURNAL_FILE, key="Course URL")
+
+    # Browsers come from the shared pool, so they stay warm for the other Selenium steps of the pipeline
+    pool = browser.default_pool()
+    with pool.driver() as driver:
+        course_links = load_course_data(driver)
+    if course_links is None:
+        return
+    if not course_links:
         print("[WARNING] No course data found.")
-        
+        return
+
+    # Course list (same entries the detail crawl starts from)
+    course_data = [
+        {key: course[key] for key in ["Course Code", "Course Title", "Course Credits"]}
+        for course in course_links if course["Course Title"] and course["Course Credits"]
+    ]
+    pd.DataFrame(course_data).to_csv(COURSE_CSV, index=False)
+    print(f"[OK] Course data saved to '{COURSE_CSV}' with {len(course_data)} entries.")
+
+    details_data = crawl_course_details(pool, course_links, journal)
+
+    df = pd.DataFrame(details_data, columns=["Course URL", "Course Code", "Course Title", "Course Credits",
+                                             "Course Description", "Prerequisites"])
+    df = df.drop(columns=["Course URL"])
+
+    # Replace empty values with fallback
+    for col in ["Course Description", "Prerequisites"]:
+        df[col] = df[col].fillna("").replace("", "Not Specified")
+
+    df.to_csv(DETAILS_CSV, index=False)
+    print(f"[OK] Detailed course data saved to '{DETAILS_CSV}' with {len(details_data)} entries.")
+
+    # Keep the journal if some courses failed, so a rerun only retries those
+    if len(details_data) == len(course_links):
+        journal.remove()
+
 # Run main process
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,11 +1,9 @@
-import time
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import fetch
+import browser
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 
 # Input and output
 ADMISSION_PAGE_URL = "https://www.upc.edu/en/masters/access-admission-enrolment/academic-requirements"
@@ -18,37 +16,30 @@ website_df = pd.read_csv(WEBSITE_DATA_CSV)
 program_ids = website_df["Program ID"].tolist()
 
 # Extract academic admission requirements
-chrome_options = Options()
-chrome_options.add_argument("--headless")
-chrome_options.add_argument("--no-sandbox")
-chrome_options.add_argument("--disable-dev-shm-usage")
-driver = webdriver.Chrome(options=chrome_options)
-driver.get(ADMISSION_PAGE_URL)
-time.sleep(2)
-
 academic_admission_requirements = "Not Specified"
-try:
+with browser.driver() as driver:
+    driver.get(ADMISSION_PAGE_URL)
+    browser.wait_for_network_idle(driver)
+
     sections = []
     buttons = driver.find_elements(By.CSS_SELECTOR, "a[data-toggle='collapse'][data-parent='#collapse-base']")
     for btn in buttons:
         title = btn.text.strip()
         driver.execute_script("arguments[0].click();", btn)
-        WebDriverWait(driver, 10).until(lambda d: btn.get_attribute("aria-expanded") == "true")
-        time.sleep(0.3)
+        browser.wait_for_attribute(driver, btn, "aria-expanded", "true")
         panel = driver.find_element(By.ID, btn.get_attribute("href").split('#')[-1])
+        WebDriverWait(driver, 10).until(EC.visibility_of(panel))
         text = panel.text.strip()
         if text:
             sections.append(f"{title}: {text}")
         # close panel
         driver.execute_script("arguments[0].click();", btn)
-        time.sleep(0.2)
+        browser.wait_for_attribute(driver, btn, "aria-expanded", "false")
     academic_admission_requirements = "\n\n".join(sections)
-finally:
-    driver.quit()
 
 # Extract language admission requirements
-resp = requests.get(LANGUAGE_PAGE_URL)
-soup = BeautifulSoup(resp.text, 'html.parser')
+resp = fetch.get(LANGUAGE_PAGE_URL)
+soup = fetch.make_soup(resp.text)
 lang_req = []
 h4 = soup.find('h4', string=lambda s: s and 'Language' in s)
 if h4:
@@ -1,11 +1,10 @@
-import requests
+import fetch
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import time
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import browser
+import checkpoint
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,17 +13,18 @@ from selenium.webdriver.support import expected_conditions as EC
 CURRICULUM_URL = "https://www.fib.upc.edu/en/studies/masters/master-informatics-engineering/curriculum"
 BASE_URL = "https://www.fib.upc.edu"
 OUTPUT_CSV = "upcfib_course_data.csv"
+JOURNAL_FILE = "upcfib_course_data.journal.jsonl"
 
-# Setup Selenium headless
-chrome_options = Options()
-chrome_options.add_argument("--headless")
-chrome_options.add_argument("--no-sandbox")
-chrome_options.add_argument("--disable-dev-shm-usage")
-driver = webdriver.Chrome(options=chrome_options)
+# Courses extracted by an interrupted run are taken from the journal instead of being fetched again
+journal = checkpoint.Journal(JOURNAL_FILE, key="Course Code")
+
+# Borrow a headless browser from the shared pool once a detail page needs one
+pool = browser.default_pool()
+driver = None
 
 print("[INFO] Requesting curriculum page...")
-response = requests.get(CURRICULUM_URL)
-soup = BeautifulSoup(response.text, 'html.parser')
+response = fetch.get(CURRICULUM_URL)
+soup = fetch.make_soup(response.text)
 
 # Find the curriculum course blocks
 print("[INFO] Extracting course entries...")
@@ -42,6 +42,10 @@ for block in course_blocks:
         credits_raw = match.group(2).strip()
         credits = credits_raw.replace("'", ".")
 
+        if code in journal:
+            courses.append(journal.get(code))
+            continue
+
         course_description = "Not Specified"
         prerequisites = "Not Specified"
 
@@ -49,13 +53,15 @@ for block in course_blocks:
         if link and ("/curriculum/syllabus/" in link or "/assignatures/" in link):
             detail_url = BASE_URL + link
             try:
+                if driver is None:
+                    driver = pool.acquire()
                 driver.get(detail_url)
 
                 # Check if the page loaded and description exists
                 WebDriverWait(driver, 5).until(
                     EC.presence_of_element_located((By.ID, "descripcio"))
                 )
-                detail_soup = BeautifulSoup(driver.page_source, "html.parser")
+                detail_soup = fetch.make_soup(driver.page_source)
 
                 # Extract description
                 desc_section = detail_soup.find("section", id="descripcio")
@@ -84,16 +90,19 @@ for block in course_blocks:
             except Exception as e:
                 print(f"[INFO] No detail page for {code}: {e}")
 
-        courses.append({
+        course = {
             "Course Code": code,
             "Course Title": title,
             "Course Credits": credits,
             "Course Description": course_description,
             "Prerequisites": prerequisites
-        })
+        }
+        journal.append(course)
+        courses.append(course)
 
 # Cleanup
-driver.quit()
+if driver is not None:
+    pool.release(driver)
 
 # Report and save to CSV
 count = len(courses)
@@ -106,4 +115,7 @@ if courses:
 else:
     df_empty = pd.DataFrame(columns=["Course Code", "Course Title", "Course Credits", "Course Description", "Prerequisites"])
     df_empty.to_csv(OUTPUT_CSV, index=False)
-    print(f"[OK] Empty course data saved to '{OUTPUT_CSV}'")
\ No newline at end of file
+    print(f"[OK] Empty course data saved to '{OUTPUT_CSV}'")
+
+# The output is complete, so the next run starts from scratch
+journal.remove()
@@ -156,4 +156,12 @@ df_out = df[[
     "tuitionAmountEUR_International (in semester)"
 ]]
 df_out.to_csv("tuitionFees_cleaned.csv", index=False)
-print("[OK] File saved as tuitionFees_cleaned.csv")
\ No newline at end of file
+print("[OK] File saved as tuitionFees_cleaned.csv")
+
+# Typed columnar copy for the notebooks (needs pyarrow)
+try:
+    df_out.astype({"Program ID": "string", "Program Title": "string", "Institution": "category",
+                   "Tuition Fees": "string", "tuitionAmounts": "string"}).to_parquet("tuitionFees_cleaned.parquet", index=False)
+    print("[OK] File saved as tuitionFees_cleaned.parquet")
+except ImportError:
+    print("[INFO] pyarrow is not installed, skipping tuitionFees_cleaned.parquet")